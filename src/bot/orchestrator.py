@@ -10,7 +10,7 @@ import re
 import time
 from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 import structlog
 from slack_bolt.app.async_app import AsyncApp
@@ -18,6 +18,7 @@ from slack_sdk.web.async_client import AsyncWebClient
 
 from ..claude.exceptions import ClaudeToolValidationError
 from ..claude.sdk_integration import StreamUpdate
+from ..claude.tool_result import ToolResult
 from ..config.settings import Settings
 from .utils.slack_format import escape_mrkdwn
 
@@ -83,6 +84,7 @@ _TOOL_ICONS: Dict[str, str] = {
     "ScheduleJob": "\u23f0",
     "ListScheduledJobs": "\u23f0",
     "RemoveScheduledJob": "\u23f0",
+    "SchedulerHelp": "\u23f0",
     "WebFetch": "\U0001f310",
     "WebSearch": "\U0001f310",
     "NotebookRead": "\U0001f4d3",
@@ -109,6 +111,9 @@ class MessageOrchestrator:
     _RECENT_EVENT_CACHE_TTL = 300.0
     _RECENT_EVENT_CACHE_MAX = 2000
 
+    # Reactions the bot has set, per (channel, message ts); bounded LRU-ish.
+    _REACTION_STATE_MAX = 500
+
     def __init__(self, settings: Settings, deps: Dict[str, Any]):
         self.settings = settings
         self.deps = deps
@@ -119,6 +124,9 @@ class MessageOrchestrator:
         self._active_tasks: Dict[str, asyncio.Task] = {}  # type: ignore[type-arg]
         # Dedup cache for Slack Socket Mode retries (see class docstring).
         self._recent_events: "OrderedDict[str, float]" = OrderedDict()
+        # Emoji the bot is known to have on each message, so redundant adds
+        # skip the Slack API round trip.
+        self._reaction_state: "OrderedDict[Tuple[str, str], Set[str]]" = OrderedDict()
 
     def _get_channel_lock(self, channel: str) -> asyncio.Lock:
         """Get or create a per-channel lock for concurrency control."""
@@ -170,6 +178,16 @@ class MessageOrchestrator:
             self._recent_events.popitem(last=False)
         return False
 
+    def _get_reaction_state(self, channel: str, message_ts: str) -> Set[str]:
+        """Get or create the set of emoji the bot has on a message."""
+        key = (channel, message_ts)
+        reactions = self._reaction_state.get(key)
+        if reactions is None:
+            reactions = self._reaction_state[key] = set()
+            while len(self._reaction_state) > self._REACTION_STATE_MAX:
+                self._reaction_state.popitem(last=False)
+        return reactions
+
     def _cancel_active_task(self, channel: str) -> bool:
         """Cancel the active Claude task for a channel. Returns True if a task was cancelled."""
         task = self._active_tasks.get(channel)
@@ -525,10 +543,12 @@ class MessageOrchestrator:
         if not deps.get("scheduler"):
             return None
 
-        async def _handle_scheduler(tool_name: str, tool_input: Dict[str, Any]) -> str:
+        async def _handle_scheduler(
+            tool_name: str, tool_input: Dict[str, Any]
+        ) -> ToolResult:
             scheduler = deps.get("scheduler")
             if not scheduler:
-                return "Scheduler is not enabled."
+                return ToolResult("Scheduler is not enabled.", is_error=True)
 
             if tool_name == "ScheduleJob":
                 job_name = tool_input.get("job_name", "Unnamed job")
@@ -537,7 +557,10 @@ class MessageOrchestrator:
                 skill_name = tool_input.get("skill_name")
 
                 if not cron_expr or not prompt:
-                    return "Error: cron_expression and prompt are required."
+                    return ToolResult(
+                        "Error: cron_expression and prompt are required.",
+                        is_error=True,
+                    )
 
                 job_id = await scheduler.add_job(
                     job_name=job_name,
@@ -548,18 +571,18 @@ class MessageOrchestrator:
                     skill_name=skill_name,
                     created_by=user_id,
                 )
-                return (
+                return ToolResult(
                     f"Job scheduled successfully.\n"
                     f"Job ID: {job_id}\n"
                     f"Name: {job_name}\n"
                     f"Schedule: {cron_expr}\n"
-                    f"Target channel: {channel}"
+                    f"Target channel: {channel}",
                 )
 
             elif tool_name == "ListScheduledJobs":
                 jobs = await scheduler.list_jobs()
                 if not jobs:
-                    return "No scheduled jobs."
+                    return ToolResult("No scheduled jobs.")
                 lines = []
                 for j in jobs:
                     lines.append(
@@ -567,16 +590,16 @@ class MessageOrchestrator:
                         f"(ID: {j.get('job_id', '?')}, "
                         f"cron: {j.get('cron_expression', '?')})"
                     )
-                return "Scheduled jobs:\n" + "\n".join(lines)
+                return ToolResult("Scheduled jobs:\n" + "\n".join(lines))
 
             elif tool_name == "RemoveScheduledJob":
                 job_id = tool_input.get("job_id", "")
                 if not job_id:
-                    return "Error: job_id is required."
+                    return ToolResult("Error: job_id is required.", is_error=True)
                 await scheduler.remove_job(job_id)
-                return f"Job {job_id} removed."
+                return ToolResult(f"Job {job_id} removed.")
 
-            return f"Unknown scheduler tool: {tool_name}"
+            return ToolResult(f"Unknown scheduler tool: {tool_name}", is_error=True)
 
         return _handle_scheduler
 
@@ -584,40 +607,50 @@ class MessageOrchestrator:
         self, channel: str, message_ts: str, client: AsyncWebClient
     ) -> Callable:
         """Create a callback that adds/removes emoji reactions on the user's message."""
+        reactions = self._get_reaction_state(channel, message_ts)
 
-        async def _react(tool_input: Dict[str, Any]) -> str:
+        async def _react(tool_input: Dict[str, Any]) -> ToolResult:
             emoji_name = tool_input.get("emoji_name", "")
             remove = tool_input.get("remove", False)
 
             if not emoji_name:
-                return "Error: emoji_name is required."
+                return ToolResult("Error: emoji_name is required.", is_error=True)
 
             # Strip colons if provided (e.g. ":thumbsup:" → "thumbsup")
             emoji_name = emoji_name.strip(":")
 
+            # Only known adds are skipped: the state is empty after a restart
+            # and bounded, so a missing entry doesn't mean Slack has none.
+            if not remove and emoji_name in reactions:
+                return ToolResult(f"Already reacted with :{emoji_name}:.")
+
             try:
                 if remove:
                     await client.reactions_remove(
                         name=emoji_name, channel=channel, timestamp=message_ts
                     )
-                    return f"Removed :{emoji_name}: reaction."
+                    reactions.discard(emoji_name)
+                    return ToolResult(f"Removed :{emoji_name}: reaction.")
                 else:
                     await client.reactions_add(
                         name=emoji_name, channel=channel, timestamp=message_ts
                     )
-                    return f"Added :{emoji_name}: reaction."
+                    reactions.add(emoji_name)
+                    return ToolResult(f"Added :{emoji_name}: reaction.")
             except Exception as e:
                 error_str = str(e)
                 if "already_reacted" in error_str:
-                    return f"Already reacted with :{emoji_name}:."
+                    reactions.add(emoji_name)
+                    return ToolResult(f"Already reacted with :{emoji_name}:.")
                 if "no_reaction" in error_str:
-                    return f"No :{emoji_name}: reaction to remove."
+                    reactions.discard(emoji_name)
+                    return ToolResult(f"No :{emoji_name}: reaction to remove.")
                 logger.warning(
                     "SlackReaction failed",
                     emoji=emoji_name,
                     error=error_str,
                 )
-                return f"Error: {error_str}"
+                return ToolResult(f"Error: {error_str}", is_error=True)
 
         return _react
 
@@ -629,17 +662,17 @@ class MessageOrchestrator:
         When Claude calls SlackFileUpload, this callback:
         1. Reads the file from disk (bypasses ToolMonitor path restrictions)
         2. Uploads it to the current Slack channel via files_upload_v2
-        3. Returns a success/failure message to Claude
+        3. Returns a ToolResult telling Claude whether the upload succeeded
         """
 
-        async def _upload_file(tool_input: Dict[str, Any]) -> str:
+        async def _upload_file(tool_input: Dict[str, Any]) -> ToolResult:
             file_path = tool_input.get("file_path", "")
             filename = tool_input.get("filename", "")
             comment = tool_input.get("comment", "")
             title = tool_input.get("title", "")
 
             if not file_path:
-                return "Error: file_path is required."
+                return ToolResult("Error: file_path is required.", is_error=True)
 
             target = Path(file_path)
 
@@ -650,15 +683,16 @@ class MessageOrchestrator:
             target = target.resolve()
 
             if not target.is_file():
-                return f"Error: File not found: {target}"
+                return ToolResult(f"Error: File not found: {target}", is_error=True)
 
             # Safety: enforce max size (50 MB)
             file_size = target.stat().st_size
             max_upload = 50 * 1024 * 1024
             if file_size > max_upload:
-                return (
+                return ToolResult(
                     f"Error: File too large ({file_size / 1024 / 1024:.1f} MB). "
-                    f"Max upload size is {max_upload // 1024 // 1024} MB."
+                    f"Max upload size is {max_upload // 1024 // 1024} MB.",
+                    is_error=True,
                 )
 
             # Derive filename if not provided
@@ -676,11 +710,11 @@ class MessageOrchestrator:
 
                 file_obj = result.get("file", {})
                 permalink = file_obj.get("permalink", "uploaded")
-                return (
+                return ToolResult(
                     f"File uploaded successfully to Slack.\n"
                     f"Filename: {filename}\n"
                     f"Size: {file_size / 1024:.1f} KB\n"
-                    f"Link: {permalink}"
+                    f"Link: {permalink}",
                 )
             except Exception as e:
                 logger.error(
@@ -690,7 +724,7 @@ class MessageOrchestrator:
                     channel=channel,
                     user_id=user_id,
                 )
-                return f"Error uploading file to Slack: {e}"
+                return ToolResult(f"Error uploading file to Slack: {e}", is_error=True)
 
         return _upload_file
 
@@ -1130,17 +1164,14 @@ class MessageOrchestrator:
         _dlog = debug_log or (lambda kind, detail: None)
 
         async def _on_stream(update_obj: StreamUpdate) -> None:
-            # Capture tool calls
-            if update_obj.tool_calls:
-                for tc in update_obj.tool_calls:
-                    name = tc.get("name", "unknown")
-                    detail = self._summarize_tool_input(name, tc.get("input", {}))
-                    tool_log.append({"kind": "tool", "name": name, "detail": detail})
-                    _dlog("TOOL", f"{name}: {detail[:200]}")
-
-            # Capture thinking (shown with thought bubble emoji)
-            if update_obj.type == "thinking" and update_obj.content:
-                text = update_obj.content.strip()
+            # Capture thinking (shown with thought bubble emoji). It arrives
+            # either on its own or attached to an assistant update.
+            if update_obj.type == "thinking":
+                thinking = update_obj.content
+            else:
+                thinking = (update_obj.metadata or {}).get("thinking")
+            if thinking:
+                text = thinking.strip()
                 _dlog("THINK", text[:300])
                 if text and verbose_level >= 1:
                     first_line = text.split("\n", 1)[0].strip()
@@ -1149,6 +1180,14 @@ class MessageOrchestrator:
                             {"kind": "thinking", "detail": first_line[:120]}
                         )
 
+            # Capture tool calls
+            if update_obj.tool_calls:
+                for tc in update_obj.tool_calls:
+                    name = tc.get("name", "unknown")
+                    detail = self._summarize_tool_input(name, tc.get("input", {}))
+                    tool_log.append({"kind": "tool", "name": name, "detail": detail})
+                    _dlog("TOOL", f"{name}: {detail[:200]}")
+
             # Capture assistant text (reasoning / commentary)
             if update_obj.type == "assistant" and update_obj.content:
                 text = update_obj.content.strip()
@@ -7,7 +7,19 @@ in regular text: &, <, >.
 """
 
 import re
-from typing import List, Tuple
+from typing import List
+
+# Patterns are compiled once at import; markdown_to_slack_mrkdwn runs on
+# every outgoing message.
+_FENCED_CODE_RE = re.compile(r"```(\w+)?\n(.*?)```", re.DOTALL)
+_INLINE_CODE_RE = re.compile(r"`([^`\n]+)`")
+_BOLD_STAR_RE = re.compile(r"\*\*(.+?)\*\*")
+_BOLD_UNDERSCORE_RE = re.compile(r"__(.+?)__")
+_ITALIC_RE = re.compile(r"(?<!\*)\*(\S.*?\S|\S)\*(?!\*)")
+_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+_HEADER_RE = re.compile(r"^#{1,6}\s+(.+)$", re.MULTILINE)
+_STRIKE_RE = re.compile(r"~~(.+?)~~")
+_PLACEHOLDER_RE = re.compile(r"\x00PH(\d+)\x00")
 
 
 def escape_mrkdwn(text: str) -> str:
@@ -42,14 +54,11 @@ def markdown_to_slack_mrkdwn(text: str) -> str:
     8. Convert strikethrough (~~text~~) -> ~text~
     9. Restore placeholders
     """
-    placeholders: List[Tuple[str, str]] = []
-    placeholder_counter = 0
+    placeholders: List[str] = []
 
     def _make_placeholder(content: str) -> str:
-        nonlocal placeholder_counter
-        key = f"\x00PH{placeholder_counter}\x00"
-        placeholder_counter += 1
-        placeholders.append((key, content))
+        key = f"\x00PH{len(placeholders)}\x00"
+        placeholders.append(content)
         return key
 
     # --- 1. Extract fenced code blocks ---
@@ -64,26 +73,21 @@ def markdown_to_slack_mrkdwn(text: str) -> str:
             slack_block = f"```\n{code}```"
         return _make_placeholder(slack_block)
 
-    text = re.sub(
-        r"```(\w+)?\n(.*?)```",
-        _replace_fenced,
-        text,
-        flags=re.DOTALL,
-    )
+    text = _FENCED_CODE_RE.sub(_replace_fenced, text)
 
     # --- 2. Extract inline code ---
     def _replace_inline_code(m: re.Match) -> str:  # type: ignore[type-arg]
         code = m.group(1)
         return _make_placeholder(f"`{code}`")
 
-    text = re.sub(r"`([^`\n]+)`", _replace_inline_code, text)
+    text = _INLINE_CODE_RE.sub(_replace_inline_code, text)
 
     # --- 3. Escape remaining text ---
     text = escape_mrkdwn(text)
 
     # --- 4. Bold: **text** or __text__ -> *text* ---
-    text = re.sub(r"\*\*(.+?)\*\*", r"*\1*", text)
-    text = re.sub(r"__(.+?)__", r"*\1*", text)
+    text = _BOLD_STAR_RE.sub(r"*\1*", text)
+    text = _BOLD_UNDERSCORE_RE.sub(r"*\1*", text)
 
     # --- 5. Italic: *text* -> _text_ (require non-space after/before) ---
     # After converting **bold** to *bold*, remaining single *text* are italic
@@ -94,27 +98,30 @@ def markdown_to_slack_mrkdwn(text: str) -> str:
     # already adjacent to word chars (which would be our bold output).
     # Actually, the bold conversion already consumed **, so remaining * pairs
     # are genuine italics from the original markdown.
-    text = re.sub(r"(?<!\*)\*(\S.*?\S|\S)\*(?!\*)", r"_\1_", text)
+    text = _ITALIC_RE.sub(r"_\1_", text)
     # _text_ only at word boundaries (avoid my_var_name)
     # Already Slack's native italic syntax -- leave as-is but ensure
     # word-boundary protection:
     # (No conversion needed; _text_ is already valid mrkdwn italic)
 
     # --- 6. Links: [text](url) -> <url|text> ---
-    text = re.sub(
-        r"\[([^\]]+)\]\(([^)]+)\)",
-        r"<\2|\1>",
-        text,
-    )
+    text = _LINK_RE.sub(r"<\2|\1>", text)
 
     # --- 7. Headers: # Header -> *Header* (bold line) ---
-    text = re.sub(r"^#{1,6}\s+(.+)$", r"*\1*", text, flags=re.MULTILINE)
+    text = _HEADER_RE.sub(r"*\1*", text)
 
     # --- 8. Strikethrough: ~~text~~ -> ~text~ ---
-    text = re.sub(r"~~(.+?)~~", r"~\1~", text)
+    text = _STRIKE_RE.sub(r"~\1~", text)
+
+    # --- 9. Restore placeholders (single pass instead of one replace each) ---
+    if placeholders:
+
+        def _restore(m: re.Match[str]) -> str:
+            index = int(m.group(1))
+            if index < len(placeholders):
+                return placeholders[index]
+            return m.group(0)
 
-    # --- 9. Restore placeholders ---
-    for key, content in placeholders:
-        text = text.replace(key, content)
+        text = _PLACEHOLDER_RE.sub(_restore, text)
 
     return text
@@ -13,11 +13,22 @@ Features:
 
 import asyncio
 import json
+import re
+import time
 import uuid
 from asyncio.subprocess import Process
 from collections import deque
 from pathlib import Path
-from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    cast,
+)
 
 import structlog
 
@@ -31,6 +42,11 @@ logger = structlog.get_logger()
 _MAX_MESSAGE_BUFFER = 1000
 _STREAM_CHUNK_SIZE = 65536  # 64 KB
 
+# stderr classification
+_USAGE_LIMIT_MARKERS = ("usage limit", "rate limit")
+# "mcp" as its own token (mcp_servers, mcp-server) but not inside "compact"
+_MCP_TOKEN_RE = re.compile(r"(?<![a-z])mcp(?![a-z])")
+
 
 class ClaudeProcessManager:
     """Manage Claude Code via CLI subprocess execution."""
@@ -38,6 +54,13 @@ class ClaudeProcessManager:
     def __init__(self, config: Settings) -> None:
         self.config = config
         self.active_processes: Dict[str, Process] = {}
+        self._stream_parsers: Dict[str, Callable[[Dict[str, Any]], StreamUpdate]] = {
+            "assistant": self._parse_assistant,
+            "user": self._parse_user,
+            "system": self._parse_system,
+            "tool_result": self._parse_tool_result,
+            "error": self._parse_error,
+        }
 
     # ------------------------------------------------------------------
     # Public API (matches ClaudeSDKManager.execute_command signature)
@@ -56,7 +79,7 @@ class ClaudeProcessManager:
         Parameters match ``ClaudeSDKManager.execute_command`` so the two
         backends are interchangeable inside ``ClaudeIntegration``.
         """
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.monotonic()
         execution_id = str(uuid.uuid4())[:8]
 
         logger.info(
@@ -196,6 +219,12 @@ class ClaudeProcessManager:
 
         assert process.stdout is not None  # guaranteed by _start_process
 
+        # The callback is fixed for the whole run, so introspect it once
+        is_coro = stream_callback is not None and asyncio.iscoroutinefunction(
+            stream_callback
+        )
+        stream_parsers = self._stream_parsers
+
         async for line in self._read_stream_bounded(process.stdout):
             line = line.strip()
             if not line:
@@ -214,20 +243,25 @@ class ClaudeProcessManager:
                 result_data = msg
                 continue
 
-            # Deliver streaming update
-            if stream_callback:
-                update = self._parse_stream_message(msg)
-                if update:
-                    try:
-                        if asyncio.iscoroutinefunction(stream_callback):
-                            await stream_callback(update)
-                        else:
-                            stream_callback(update)
-                    except Exception as cb_err:
-                        logger.warning(
-                            "Stream callback error",
-                            error=str(cb_err),
-                        )
+            # Deliver streaming update; types without a parser (e.g. rate
+            # limit notices) are only kept for the final result
+            if stream_callback is None:
+                continue
+            parser = stream_parsers.get(msg_type)
+            if parser is None:
+                continue
+
+            update = parser(msg)
+            try:
+                if is_coro:
+                    await cast(Awaitable[None], stream_callback(update))
+                else:
+                    stream_callback(update)
+            except Exception as cb_err:
+                logger.warning(
+                    "Stream callback error",
+                    error=str(cb_err),
+                )
 
         # Wait for the process to finish
         stderr_bytes = b""
@@ -235,35 +269,57 @@ class ClaudeProcessManager:
             stderr_bytes = await process.stderr.read()
         await process.wait()
 
-        duration_ms = int((asyncio.get_event_loop().time() - start_time) * 1000)
+        duration_ms = int((time.monotonic() - start_time) * 1000)
+
+        # Walk the collected messages for tool usage once, whichever path
+        # builds the response.
+        collected = list(messages)
+        tools_used = self._extract_tools_from_messages(collected)
 
         # Handle non-zero exit
         if process.returncode and process.returncode != 0:
             stderr_text = stderr_bytes.decode("utf-8", errors="replace").strip()
             return self._handle_process_error(
-                process.returncode, stderr_text, list(messages), duration_ms
+                process.returncode,
+                stderr_text,
+                collected,
+                duration_ms,
+                tools_used=tools_used,
             )
 
         # Parse the final result
-        return self._parse_result(result_data, list(messages), duration_ms)
+        return self._parse_result(
+            result_data, collected, duration_ms, tools_used=tools_used
+        )
 
     async def _read_stream_bounded(
         self, stream: asyncio.StreamReader
     ) -> AsyncIterator[str]:
-        """Yield decoded lines from an async stream with bounded reads."""
-        buffer = ""
+        """Yield decoded lines from an async stream with bounded reads.
+
+        Raw bytes accumulate in a ``bytearray`` that is consumed in place, so
+        a long line spanning many chunks is not re-copied on every read.
+        Lines are decoded whole, which also keeps multi-byte characters
+        split across a chunk boundary intact.
+        """
+        buffer = bytearray()
+        search_from = 0
         while True:
             chunk = await stream.read(_STREAM_CHUNK_SIZE)
             if not chunk:
                 # Flush remaining buffer
                 if buffer:
-                    yield buffer
+                    yield buffer.decode("utf-8", errors="replace")
                 break
 
-            buffer += chunk.decode("utf-8", errors="replace")
-            while "\n" in buffer:
-                line, buffer = buffer.split("\n", 1)
+            buffer.extend(chunk)
+            while (idx := buffer.find(b"\n", search_from)) != -1:
+                line = buffer[:idx].decode("utf-8", errors="replace")
+                del buffer[: idx + 1]
+                search_from = 0
                 yield line
+            # Nothing before this point contains a newline; skip it next time
+            search_from = len(buffer)
 
     # ------------------------------------------------------------------
     # Message parsing
@@ -272,84 +328,91 @@ class ClaudeProcessManager:
     def _parse_stream_message(self, msg: Dict[str, Any]) -> Optional[StreamUpdate]:
         """Convert a stream-json message dict into a ``StreamUpdate``."""
         msg_type = msg.get("type", "")
+        parser = self._stream_parsers.get(msg_type)
+        if parser is None:
+            # Unknown types — log and skip
+            logger.debug("Skipping unknown stream message type", msg_type=msg_type)
+            return None
+        return parser(msg)
 
-        if msg_type == "assistant":
-            content_blocks = msg.get("message", {}).get("content", [])
-            text_parts: List[str] = []
-            tool_calls: List[Dict[str, Any]] = []
-
-            for block in content_blocks:
-                if isinstance(block, dict):
-                    if block.get("type") == "text":
-                        text_parts.append(block.get("text", ""))
-                    elif block.get("type") == "tool_use":
-                        tool_calls.append(
-                            {
-                                "tool_name": block.get("name", ""),
-                                "tool_id": block.get("id", ""),
-                                "input": block.get("input", {}),
-                            }
-                        )
-                elif isinstance(block, str):
-                    text_parts.append(block)
+    @staticmethod
+    def _parse_assistant(msg: Dict[str, Any]) -> StreamUpdate:
+        content_blocks = msg.get("message", {}).get("content", [])
+        text_parts: List[str] = []
+        tool_calls: List[Dict[str, Any]] = []
+        add_text = text_parts.append
+
+        for block in content_blocks:
+            if isinstance(block, dict):
+                block_type = block.get("type")
+                if block_type == "text":
+                    add_text(block.get("text", ""))
+                elif block_type == "tool_use":
+                    tool_calls.append(
+                        {
+                            "tool_name": block.get("name", ""),
+                            "tool_id": block.get("id", ""),
+                            "input": block.get("input", {}),
+                        }
+                    )
+            elif isinstance(block, str):
+                add_text(block)
 
-            return StreamUpdate(
-                type="assistant",
-                content="\n".join(text_parts) if text_parts else None,
-                tool_calls=tool_calls or None,
-            )
+        return StreamUpdate(
+            type="assistant",
+            content="\n".join(text_parts) if text_parts else None,
+            tool_calls=tool_calls or None,
+        )
 
-        if msg_type == "user":
-            content = msg.get("message", {}).get("content", "")
-            if isinstance(content, list):
-                content = " ".join(
-                    b.get("text", "") if isinstance(b, dict) else str(b)
-                    for b in content
-                )
-            return StreamUpdate(type="user", content=str(content))
-
-        if msg_type == "system":
-            subtype = msg.get("subtype", "")
-            return StreamUpdate(
-                type="system",
-                content=msg.get("message", ""),
-                metadata={
-                    "subtype": subtype,
-                    "tools": msg.get("tools", []),
-                    "model": msg.get("model", ""),
-                    "mcp_servers": msg.get("mcp_servers", []),
-                },
+    @staticmethod
+    def _parse_user(msg: Dict[str, Any]) -> StreamUpdate:
+        content = msg.get("message", {}).get("content", "")
+        if isinstance(content, list):
+            content = " ".join(
+                b.get("text", "") if isinstance(b, dict) else str(b) for b in content
             )
+        return StreamUpdate(type="user", content=str(content))
 
-        if msg_type == "tool_result":
-            content = msg.get("content", "")
-            if isinstance(content, list):
-                content = " ".join(
-                    b.get("text", "") if isinstance(b, dict) else str(b)
-                    for b in content
-                )
-            return StreamUpdate(
-                type="tool_result",
-                content=str(content),
-                metadata={
-                    "tool_use_id": msg.get("tool_use_id", ""),
-                    "is_error": msg.get("is_error", False),
-                },
-            )
+    @staticmethod
+    def _parse_system(msg: Dict[str, Any]) -> StreamUpdate:
+        return StreamUpdate(
+            type="system",
+            content=msg.get("message", ""),
+            metadata={
+                "subtype": msg.get("subtype", ""),
+                "tools": msg.get("tools", []),
+                "model": msg.get("model", ""),
+                "mcp_servers": msg.get("mcp_servers", []),
+            },
+        )
 
-        if msg_type == "error":
-            return StreamUpdate(
-                type="error",
-                content=msg.get("error", {}).get("message", str(msg)),
-                metadata={
-                    "code": msg.get("error", {}).get("code", ""),
-                    "subtype": msg.get("subtype", ""),
-                },
+    @staticmethod
+    def _parse_tool_result(msg: Dict[str, Any]) -> StreamUpdate:
+        content = msg.get("content", "")
+        if isinstance(content, list):
+            content = " ".join(
+                b.get("text", "") if isinstance(b, dict) else str(b) for b in content
             )
+        return StreamUpdate(
+            type="tool_result",
+            content=str(content),
+            metadata={
+                "tool_use_id": msg.get("tool_use_id", ""),
+                "is_error": msg.get("is_error", False),
+            },
+        )
 
-        # Unknown types — log and skip
-        logger.debug("Skipping unknown stream message type", msg_type=msg_type)
-        return None
+    @staticmethod
+    def _parse_error(msg: Dict[str, Any]) -> StreamUpdate:
+        error = msg.get("error", {})
+        return StreamUpdate(
+            type="error",
+            content=error.get("message", str(msg)),
+            metadata={
+                "code": error.get("code", ""),
+                "subtype": msg.get("subtype", ""),
+            },
+        )
 
     # ------------------------------------------------------------------
     # Result extraction
@@ -360,15 +423,18 @@ class ClaudeProcessManager:
         result_data: Optional[Dict[str, Any]],
         messages: List[Dict[str, Any]],
         duration_ms: int,
+        tools_used: Optional[List[Dict[str, Any]]] = None,
     ) -> ClaudeResponse:
         """Build a ``ClaudeResponse`` from the final result message."""
+        if tools_used is None:
+            tools_used = self._extract_tools_from_messages(messages)
+
         if result_data:
             content = result_data.get("result", "") or ""
             session_id = result_data.get("session_id", "")
             cost = result_data.get("cost_usd", 0.0) or 0.0
             num_turns = result_data.get("num_turns", 0) or 0
             is_error = result_data.get("is_error", False)
-            tools_used = self._extract_tools_from_messages(messages)
         else:
             # Fallback: collect text from assistant messages
             content = self._extract_content_fallback(messages)
@@ -376,7 +442,6 @@ class ClaudeProcessManager:
             cost = 0.0
             num_turns = 0
             is_error = False
-            tools_used = self._extract_tools_from_messages(messages)
 
         return ClaudeResponse(
             content=content,
@@ -394,6 +459,7 @@ class ClaudeProcessManager:
         stderr_text: str,
         messages: List[Dict[str, Any]],
         duration_ms: int,
+        tools_used: Optional[List[Dict[str, Any]]] = None,
     ) -> ClaudeResponse:
         """Handle non-zero exit code from the CLI process."""
         logger.error(
@@ -403,12 +469,12 @@ class ClaudeProcessManager:
         )
 
         # Detect specific error types
-        lower_stderr = stderr_text.lower()
+        lower_stderr = stderr_text.lower() if stderr_text else ""
 
-        if "usage limit" in lower_stderr or "rate limit" in lower_stderr:
+        if lower_stderr and any(m in lower_stderr for m in _USAGE_LIMIT_MARKERS):
             error_type = "usage_limit"
             content = "Claude usage limit reached. Please wait before trying again."
-        elif "mcp" in lower_stderr:
+        elif lower_stderr and _MCP_TOKEN_RE.search(lower_stderr):
             error_type = "mcp_error"
             content = f"MCP server error: {stderr_text[:300]}"
         else:
@@ -426,7 +492,11 @@ class ClaudeProcessManager:
             num_turns=0,
             is_error=True,
             error_type=error_type,
-            tools_used=self._extract_tools_from_messages(messages),
+            tools_used=(
+                tools_used
+                if tools_used is not None
+                else self._extract_tools_from_messages(messages)
+            ),
         )
 
     # ------------------------------------------------------------------
@@ -437,14 +507,15 @@ class ClaudeProcessManager:
     def _extract_content_fallback(messages: List[Dict[str, Any]]) -> str:
         """Collect text from assistant messages as a content fallback."""
         parts: List[str] = []
+        add_part = parts.append
         for msg in messages:
             if msg.get("type") != "assistant":
                 continue
             for block in msg.get("message", {}).get("content", []):
                 if isinstance(block, dict) and block.get("type") == "text":
-                    parts.append(block["text"])
+                    add_part(block["text"])
                 elif isinstance(block, str):
-                    parts.append(block)
+                    add_part(block)
         return "\n".join(parts)
 
     @staticmethod
@@ -453,12 +524,13 @@ class ClaudeProcessManager:
     ) -> List[Dict[str, Any]]:
         """Extract tool usage records from collected messages."""
         tools: List[Dict[str, Any]] = []
+        add_tool = tools.append
         for msg in messages:
             if msg.get("type") != "assistant":
                 continue
             for block in msg.get("message", {}).get("content", []):
                 if isinstance(block, dict) and block.get("type") == "tool_use":
-                    tools.append(
+                    add_tool(
                         {
                             "tool_name": block.get("name", ""),
                             "tool_id": block.get("id", ""),
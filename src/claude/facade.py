@@ -99,8 +99,10 @@ class ClaudeIntegration:
                 "ScheduleJob",
                 "ListScheduledJobs",
                 "RemoveScheduledJob",
+                "SchedulerHelp",
                 "SlackFileUpload",
                 "SlackReaction",
+                "BatchExecute",
             }
 
             # Validate tool calls
@@ -1,182 +1,498 @@
 """In-process MCP tools for the Slack bot.
 
 Registers SlackFileUpload, SlackReaction, ScheduleJob, ListScheduledJobs,
-and RemoveScheduledJob as real SDK MCP tools so Claude discovers them
-natively (no system-prompt hacking or permission-deny interception).
+RemoveScheduledJob and SchedulerHelp as real SDK MCP tools so Claude
+discovers them natively (no system-prompt hacking or permission-deny
+interception).
+BatchExecute fans several of those calls out in a single tool round trip.
 """
 
-from typing import Any, Callable, Dict, Optional
+import asyncio
+import functools
+import json
+import time
+from collections import Counter
+from typing import (
+    AbstractSet,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from claude_agent_sdk import McpSdkServerConfig, SdkMcpTool, create_sdk_mcp_server, tool
 
+from .tool_result import (
+    BatchCall,
+    BatchExecuteArgs,
+    FileUploadArgs,
+    ReactionArgs,
+    RemoveJobArgs,
+    ScheduleJobArgs,
+    ToolResult,
+)
 
-def create_bot_mcp_server(
-    file_upload_fn: Optional[Callable] = None,
-    scheduler_fn: Optional[Callable] = None,
-    reaction_fn: Optional[Callable] = None,
-) -> McpSdkServerConfig:
-    """Build an in-process MCP server with the bot's custom tools.
+# Prefixes that mark a plain-string callback result as a failure.
+_ERROR_PREFIXES: Tuple[str, ...] = ("Error", "ERROR:", "error:")
 
-    Args:
-        file_upload_fn: async (tool_input: dict) -> str
-        scheduler_fn:   async (tool_name: str, tool_input: dict) -> str
-        reaction_fn:    async (tool_input: dict) -> str
+# Bot tool callbacks are async-only; they run on the event loop.
+_ToolCallback = Callable[[Dict[str, Any]], Awaitable[Union[ToolResult, str]]]
+_SchedulerCallback = Callable[[str, Dict[str, Any]], Awaitable[Union[ToolResult, str]]]
+
+
+def _legacy_adapt(
+    fn: Callable[..., Awaitable[Union[ToolResult, str]]],
+) -> Callable[..., Awaitable[ToolResult]]:
+    """Wrap a callback so plain-string results become ToolResults.
+
+    Callbacks written against the old contract return prose and signal
+    failure by starting it with one of _ERROR_PREFIXES; ToolResults pass
+    through untouched.
     """
-    tools: list[SdkMcpTool[Any]] = []
 
-    # ── SlackFileUpload ──────────────────────────────────────────────
-    if file_upload_fn:
+    @functools.wraps(fn)
+    async def adapted(*args: Any) -> ToolResult:
+        result = await fn(*args)
+        if isinstance(result, ToolResult):
+            return result
+        return ToolResult(result, is_error=result.startswith(_ERROR_PREFIXES))
 
-        @tool(
-            "SlackFileUpload",
-            "Upload a file or image to the current Slack channel. "
-            "Use this whenever you need to send a file to the user.",
-            {
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to the file to upload (absolute or relative to working directory)",
-                    },
-                    "filename": {
-                        "type": "string",
-                        "description": "Display name for the file in Slack (optional, defaults to file name)",
-                    },
-                    "title": {
-                        "type": "string",
-                        "description": "Title shown above the file in Slack (optional)",
-                    },
-                    "comment": {
-                        "type": "string",
-                        "description": "Message posted alongside the file (optional)",
-                    },
-                },
-                "required": ["file_path"],
-            },
-        )
-        async def slack_file_upload(args: Dict[str, Any]) -> Dict[str, Any]:
-            result = await file_upload_fn(args)
-            is_error = result.startswith("Error")
-            return {
-                "content": [{"type": "text", "text": result}],
-                "is_error": is_error,
-            }
-
-        tools.append(slack_file_upload)
-
-    # ── SlackReaction ─────────────────────────────────────────────────
-    if reaction_fn:
+    return adapted
 
-        @tool(
-            "SlackReaction",
-            "React to the user's Slack message with an emoji — like a human "
-            "coworker would. Use sparingly and naturally: to acknowledge a "
-            "request, celebrate, or show empathy. Don't react to every message.",
-            {
-                "type": "object",
-                "properties": {
-                    "emoji_name": {
-                        "type": "string",
-                        "description": (
-                            "Emoji name without colons (e.g. 'thumbsup', 'eyes', "
-                            "'tada', 'fire', 'heart', 'thinking_face', 'white_check_mark')"
-                        ),
-                    },
-                    "remove": {
-                        "type": "boolean",
-                        "description": "Set true to remove a reaction instead of adding",
-                    },
-                },
-                "required": ["emoji_name"],
-            },
-        )
-        async def slack_reaction(args: Dict[str, Any]) -> Dict[str, Any]:
-            result = await reaction_fn(args)
-            is_error = result.startswith("Error")
-            return {
-                "content": [{"type": "text", "text": result}],
-                "is_error": is_error,
-            }
-
-        tools.append(slack_reaction)
-
-    # ── Scheduler tools ──────────────────────────────────────────────
-    if scheduler_fn:
 
-        @tool(
-            "ScheduleJob",
-            "Schedule a recurring cron job that runs a prompt on a schedule.",
-            {
+# Claude often repeats ListScheduledJobs verbatim (e.g. to confirm a change);
+# within this window the last successful listing is reused. Redundant
+# reactions are skipped by the orchestrator's per-message reaction state.
+_LIST_JOBS_CACHE_TTL = 5.0
+
+
+def _memoize_job_listing(
+    scheduler_fn: Callable[[str, Dict[str, Any]], Awaitable[ToolResult]],
+) -> Callable[[str, Dict[str, Any]], Awaitable[ToolResult]]:
+    """Reuse a recent ListScheduledJobs result until a job is added/removed."""
+    listing: Optional[Tuple[float, ToolResult]] = None
+
+    async def memoized(tool_name: str, args: Dict[str, Any]) -> ToolResult:
+        nonlocal listing
+        if tool_name != "ListScheduledJobs":
+            listing = None
+            return await scheduler_fn(tool_name, args)
+
+        now = time.monotonic()
+        if listing and now - listing[0] < _LIST_JOBS_CACHE_TTL:
+            return listing[1]
+        result = await scheduler_fn(tool_name, args)
+        listing = (now, result) if not result.is_error else None
+        return result
+
+    return memoized
+
+
+def _to_content(result: ToolResult) -> Dict[str, Any]:
+    return {
+        "content": [{"type": "text", "text": result.text}],
+        "is_error": result.is_error,
+    }
+
+
+# Error text goes back into the conversation on every retry, so it is capped,
+# and the same failure repeated too often is cut off instead of echoed again.
+_MAX_ERROR_CHARS = 512
+_MAX_REPEATED_ERRORS = 3
+_ERROR_KEY_CHARS = 80
+
+
+class _ErrorBudget:
+    """Per-server tracker that trims error results and detects retry loops."""
+
+    def __init__(self) -> None:
+        self._seen: Counter[Tuple[str, str]] = Counter()
+
+    def screen(self, tool_name: str, result: ToolResult) -> ToolResult:
+        if not result.is_error:
+            return result
+
+        text = result.text
+        key = (tool_name, text[:_ERROR_KEY_CHARS])
+        self._seen[key] += 1
+        if self._seen[key] > _MAX_REPEATED_ERRORS:
+            return ToolResult(
+                f"REPEATED_ERROR: {tool_name} failed the same way "
+                f"{self._seen[key]} times; stop retrying and tell the user.",
+                is_error=True,
+            )
+        if len(text) > _MAX_ERROR_CHARS:
+            text = text[:_MAX_ERROR_CHARS] + "…[truncated]"
+        return ToolResult(text, is_error=True)
+
+
+_SCHEDULER_TOOL_NAMES = ("ScheduleJob", "ListScheduledJobs", "RemoveScheduledJob")
+
+BOT_TOOL_NAMES: AbstractSet[str] = frozenset(
+    ("SlackFileUpload", "SlackReaction", "BatchExecute", "SchedulerHelp")
+    + _SCHEDULER_TOOL_NAMES
+)
+
+# Tool descriptions and input schemas are static, so they are built once at
+# import instead of on every create_bot_mcp_server() call (one per request).
+
+# ── SlackFileUpload ──────────────────────────────────────────────────
+_FILE_UPLOAD_DESC = (
+    "Upload a file or image to the current Slack channel. "
+    "Use this whenever you need to send a file to the user."
+)
+_FILE_UPLOAD_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "file_path": {
+            "type": "string",
+            "description": "Path to the file to upload (absolute or relative to working directory)",
+        },
+        "filename": {
+            "type": "string",
+            "description": "Display name for the file in Slack (optional, defaults to file name)",
+        },
+        "title": {
+            "type": "string",
+            "description": "Title shown above the file in Slack (optional)",
+        },
+        "comment": {
+            "type": "string",
+            "description": "Message posted alongside the file (optional)",
+        },
+    },
+    "required": ["file_path"],
+}
+
+# ── SlackReaction ────────────────────────────────────────────────────
+# When and how often to react is covered once in the system prompt.
+_REACTION_DESC = "Add or remove an emoji reaction on the user's Slack message."
+_REACTION_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "emoji_name": {
+            "type": "string",
+            "description": (
+                "Emoji name without colons (e.g. 'thumbsup', 'eyes', "
+                "'tada', 'fire', 'heart', 'thinking_face', 'white_check_mark')"
+            ),
+        },
+        "remove": {
+            "type": "boolean",
+            "description": "Set true to remove a reaction instead of adding",
+        },
+    },
+    "required": ["emoji_name"],
+}
+
+# ── Scheduler tools ──────────────────────────────────────────────────
+# Descriptions are sent on every turn; the cron primer is served on demand by
+# SchedulerHelp instead.
+_SCHEDULE_JOB_DESC = (
+    "Schedule a recurring cron job that runs a prompt. "
+    "Call SchedulerHelp for cron syntax examples."
+)
+_SCHEDULE_JOB_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "job_name": {
+            "type": "string",
+            "description": "Human-readable name for the job",
+        },
+        "cron_expression": {
+            "type": "string",
+            "description": "Standard 5-field crontab schedule",
+        },
+        "prompt": {
+            "type": "string",
+            "description": "The prompt to send to Claude when the job fires",
+        },
+        "skill_name": {
+            "type": "string",
+            "description": "Optional skill to invoke (e.g. 'commit')",
+        },
+    },
+    "required": ["job_name", "cron_expression", "prompt"],
+}
+
+_SCHEDULER_HELP_DESC = "Get the cron syntax reference and examples for ScheduleJob."
+_SCHEDULER_HELP_SCHEMA: Dict[str, Any] = {"type": "object", "properties": {}}
+_SCHEDULER_HELP_TEXT = (
+    "cron_expression is a standard 5-field crontab schedule: "
+    "minute hour day-of-month month day-of-week.\n"
+    "Day-of-week: 0=Sun, 1=Mon, 2=Tue, 3=Wed, 4=Thu, 5=Fri, 6=Sat "
+    "(or named: SUN,MON,TUE,WED,THU,FRI,SAT).\n"
+    "Examples:\n"
+    "- '0 9 * * 1-5' weekdays 9am\n"
+    "- '0 10 * * 3' Wednesday 10am\n"
+    "- '*/30 * * * *' every 30min"
+)
+
+_LIST_JOBS_DESC = "List all active scheduled jobs."
+_LIST_JOBS_SCHEMA: Dict[str, Any] = {"type": "object", "properties": {}}
+
+_REMOVE_JOB_DESC = "Remove a scheduled job by its ID."
+_REMOVE_JOB_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "job_id": {
+            "type": "string",
+            "description": "The ID of the job to remove",
+        },
+    },
+    "required": ["job_id"],
+}
+
+# ── BatchExecute ─────────────────────────────────────────────────────
+_BATCH_MAX_CONCURRENT = 4
+
+_BATCH_DESC = (
+    "Run several SlackFileUpload, SlackReaction or scheduler tool calls in "
+    "one step instead of one tool call each. Calls run concurrently and "
+    "results are returned as a JSON list in the same order."
+)
+_BATCH_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "calls": {
+            "type": "array",
+            "description": "Tool calls to run",
+            "items": {
                 "type": "object",
                 "properties": {
-                    "job_name": {
+                    "tool_name": {
                         "type": "string",
-                        "description": "Human-readable name for the job",
+                        "description": "Name of the bot tool (e.g. 'SlackReaction')",
                     },
-                    "cron_expression": {
-                        "type": "string",
-                        "description": (
-                            "Standard 5-field crontab schedule. "
-                            "Day-of-week: 0=Sun, 1=Mon, 2=Tue, 3=Wed, 4=Thu, 5=Fri, 6=Sat "
-                            "(or named: SUN,MON,TUE,WED,THU,FRI,SAT). "
-                            "Examples: '0 9 * * 1-5' weekdays 9am, "
-                            "'0 10 * * 3' Wednesday 10am, "
-                            "'*/30 * * * *' every 30min"
-                        ),
-                    },
-                    "prompt": {
-                        "type": "string",
-                        "description": "The prompt to send to Claude when the job fires",
-                    },
-                    "skill_name": {
-                        "type": "string",
-                        "description": "Optional skill to invoke (e.g. 'commit')",
+                    "arguments": {
+                        "type": "object",
+                        "description": "Input for that tool, as for a direct call",
                     },
                 },
-                "required": ["job_name", "cron_expression", "prompt"],
+                "required": ["tool_name"],
             },
-        )
-        async def schedule_job(args: Dict[str, Any]) -> Dict[str, Any]:
-            result = await scheduler_fn("ScheduleJob", args)
-            is_error = result.startswith("Error")
-            return {
-                "content": [{"type": "text", "text": result}],
-                "is_error": is_error,
-            }
+        },
+        "stop_on_error": {
+            "type": "boolean",
+            "description": "Cancel the remaining calls once one fails (default false)",
+        },
+        "max_concurrent": {
+            "type": "integer",
+            "description": (
+                f"Maximum calls in flight at once (default {_BATCH_MAX_CONCURRENT})"
+            ),
+        },
+    },
+    "required": ["calls"],
+}
+
+
+async def _run_and_wrap(
+    errors: _ErrorBudget, tool_name: str, fn: Callable, *fn_args: Any
+) -> Dict[str, Any]:
+    """Call a tool callback and build its MCP response (shared by all tools)."""
+    result = await fn(*fn_args)
+    return _to_content(errors.screen(tool_name, result))
+
+
+def _make_file_upload_tool(
+    file_upload_fn: Callable, errors: _ErrorBudget
+) -> SdkMcpTool[Any]:
+    @tool("SlackFileUpload", _FILE_UPLOAD_DESC, _FILE_UPLOAD_SCHEMA)
+    async def slack_file_upload(args: FileUploadArgs) -> Dict[str, Any]:
+        return await _run_and_wrap(errors, "SlackFileUpload", file_upload_fn, args)
+
+    return slack_file_upload
+
+
+def _make_reaction_tool(reaction_fn: Callable, errors: _ErrorBudget) -> SdkMcpTool[Any]:
+    @tool("SlackReaction", _REACTION_DESC, _REACTION_SCHEMA)
+    async def slack_reaction(args: ReactionArgs) -> Dict[str, Any]:
+        return await _run_and_wrap(errors, "SlackReaction", reaction_fn, args)
+
+    return slack_reaction
+
+
+def _make_scheduler_tools(
+    scheduler_fn: Callable, enabled: Callable[[str], bool], errors: _ErrorBudget
+) -> List[SdkMcpTool[Any]]:
+    tools: List[SdkMcpTool[Any]] = []
+
+    if enabled("ScheduleJob"):
+
+        @tool("ScheduleJob", _SCHEDULE_JOB_DESC, _SCHEDULE_JOB_SCHEMA)
+        async def schedule_job(args: ScheduleJobArgs) -> Dict[str, Any]:
+            return await _run_and_wrap(
+                errors, "ScheduleJob", scheduler_fn, "ScheduleJob", args
+            )
 
         tools.append(schedule_job)
 
-        @tool(
-            "ListScheduledJobs",
-            "List all active scheduled jobs.",
-            {"type": "object", "properties": {}},
-        )
+    if enabled("ListScheduledJobs"):
+
+        @tool("ListScheduledJobs", _LIST_JOBS_DESC, _LIST_JOBS_SCHEMA)
         async def list_scheduled_jobs(args: Dict[str, Any]) -> Dict[str, Any]:
-            result = await scheduler_fn("ListScheduledJobs", args)
-            return {"content": [{"type": "text", "text": result}]}
+            return await _run_and_wrap(
+                errors, "ListScheduledJobs", scheduler_fn, "ListScheduledJobs", args
+            )
 
         tools.append(list_scheduled_jobs)
 
-        @tool(
-            "RemoveScheduledJob",
-            "Remove a scheduled job by its ID.",
-            {
-                "type": "object",
-                "properties": {
-                    "job_id": {
-                        "type": "string",
-                        "description": "The ID of the job to remove",
-                    },
-                },
-                "required": ["job_id"],
-            },
-        )
-        async def remove_scheduled_job(args: Dict[str, Any]) -> Dict[str, Any]:
-            result = await scheduler_fn("RemoveScheduledJob", args)
-            return {"content": [{"type": "text", "text": result}]}
+    if enabled("RemoveScheduledJob"):
+
+        @tool("RemoveScheduledJob", _REMOVE_JOB_DESC, _REMOVE_JOB_SCHEMA)
+        async def remove_scheduled_job(args: RemoveJobArgs) -> Dict[str, Any]:
+            return await _run_and_wrap(
+                errors, "RemoveScheduledJob", scheduler_fn, "RemoveScheduledJob", args
+            )
 
         tools.append(remove_scheduled_job)
 
+    if enabled("SchedulerHelp"):
+
+        @tool("SchedulerHelp", _SCHEDULER_HELP_DESC, _SCHEDULER_HELP_SCHEMA)
+        async def scheduler_help(args: Dict[str, Any]) -> Dict[str, Any]:
+            return _to_content(ToolResult(_SCHEDULER_HELP_TEXT))
+
+        tools.append(scheduler_help)
+
+    return tools
+
+
+def _make_batch_tool(
+    handlers: Dict[str, Callable], errors: _ErrorBudget
+) -> SdkMcpTool[Any]:
+    """Build BatchExecute over ``handlers`` (tool name -> async (args) -> ToolResult)."""
+
+    @tool("BatchExecute", _BATCH_DESC, _BATCH_SCHEMA)
+    async def batch_execute(args: BatchExecuteArgs) -> Dict[str, Any]:
+        calls = args.get("calls") or []
+        if not isinstance(calls, list) or not all(isinstance(c, dict) for c in calls):
+            return _to_content(
+                ToolResult("Error: calls must be a list of objects.", is_error=True)
+            )
+        stop_on_error = bool(args.get("stop_on_error", False))
+        raw_limit = args.get("max_concurrent")
+        try:
+            max_concurrent = (
+                _BATCH_MAX_CONCURRENT if raw_limit is None else int(raw_limit)
+            )
+        except (TypeError, ValueError):
+            return _to_content(
+                ToolResult("Error: max_concurrent must be an integer.", is_error=True)
+            )
+        if max_concurrent < 1:
+            return _to_content(
+                ToolResult("Error: max_concurrent must be at least 1.", is_error=True)
+            )
+        semaphore = asyncio.Semaphore(max_concurrent)
+        tasks: List["asyncio.Task[Optional[ToolResult]]"] = []
+        # With an eager task factory a call can fail before later tasks exist,
+        # so those check this flag instead of relying on cancel() alone.
+        stopped = False
+
+        async def _run(call: BatchCall) -> Optional[ToolResult]:
+            nonlocal stopped
+            if stopped:
+                return None
+            tool_name = call.get("tool_name", "")
+            handler = handlers.get(tool_name)
+            if handler is None:
+                result = ToolResult(f"Error: unknown tool {tool_name!r}", is_error=True)
+            else:
+                async with semaphore:
+                    if stopped:
+                        return None
+                    try:
+                        result = await handler(call.get("arguments") or {})
+                    except Exception as e:
+                        result = ToolResult(f"Error: {e}", is_error=True)
+
+            result = errors.screen(tool_name, result)
+            if result.is_error and stop_on_error:
+                stopped = True
+                current = asyncio.current_task()
+                for task in tasks:
+                    if task is not current:
+                        task.cancel()
+            return result
+
+        tasks.extend(asyncio.ensure_future(_run(call)) for call in calls)
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+
+        results: List[Dict[str, Any]] = []
+        for call, outcome in zip(calls, outcomes):
+            entry: Dict[str, Any] = {"tool_name": call.get("tool_name", "")}
+            if isinstance(outcome, ToolResult):
+                entry["is_error"] = outcome.is_error
+                entry["text"] = outcome.text
+            elif outcome is None or isinstance(outcome, asyncio.CancelledError):
+                entry["skipped"] = True
+            else:
+                entry["is_error"] = True
+                entry["text"] = f"Error: {outcome}"
+            results.append(entry)
+
+        return {
+            "content": [{"type": "text", "text": json.dumps(results)}],
+            "is_error": any(r.get("is_error") for r in results),
+        }
+
+    return batch_execute
+
+
+def create_bot_mcp_server(
+    file_upload_fn: Optional[_ToolCallback] = None,
+    scheduler_fn: Optional[_SchedulerCallback] = None,
+    reaction_fn: Optional[_ToolCallback] = None,
+    enabled_tools: Optional[AbstractSet[str]] = None,
+) -> McpSdkServerConfig:
+    """Build an in-process MCP server with the bot's custom tools.
+
+    Every registered tool's schema is sent to Claude on each turn, so tools
+    outside ``enabled_tools`` (when given) are not registered at all.
+    Callbacks still returning plain strings are adapted via _legacy_adapt.
+
+    Args:
+        file_upload_fn: async (tool_input: dict) -> ToolResult | str
+        scheduler_fn:   async (tool_name: str, tool_input: dict) -> ToolResult | str
+        reaction_fn:    async (tool_input: dict) -> ToolResult | str
+        enabled_tools:  names from BOT_TOOL_NAMES to register (default: all)
+    """
+
+    def enabled(name: str) -> bool:
+        return enabled_tools is None or name in enabled_tools
+
+    if file_upload_fn:
+        file_upload_fn = _legacy_adapt(file_upload_fn)
+    if reaction_fn:
+        reaction_fn = _legacy_adapt(reaction_fn)
+    if scheduler_fn:
+        scheduler_fn = _memoize_job_listing(_legacy_adapt(scheduler_fn))
+
+    tools: list[SdkMcpTool[Any]] = []
+    handlers: Dict[str, Callable] = {}
+    errors = _ErrorBudget()
+
+    if file_upload_fn and enabled("SlackFileUpload"):
+        tools.append(_make_file_upload_tool(file_upload_fn, errors))
+        handlers["SlackFileUpload"] = file_upload_fn
+    if reaction_fn and enabled("SlackReaction"):
+        tools.append(_make_reaction_tool(reaction_fn, errors))
+        handlers["SlackReaction"] = reaction_fn
+    if scheduler_fn:
+        tools.extend(_make_scheduler_tools(scheduler_fn, enabled, errors))
+        for name in _SCHEDULER_TOOL_NAMES:
+            if enabled(name):
+                handlers[name] = functools.partial(scheduler_fn, name)
+
+    if handlers and enabled("BatchExecute"):
+        tools.append(_make_batch_tool(handlers, errors))
+
     return create_sdk_mcp_server(
         name="slack-bot-tools",
         version="1.0.0",
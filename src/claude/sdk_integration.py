@@ -8,27 +8,27 @@ Features:
 """
 
 import asyncio
+import functools
 import os
+import threading
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 
 import structlog
-from claude_agent_sdk import (
-    AssistantMessage,
-    ClaudeAgentOptions,
-    ClaudeSDKClient,
-    ClaudeSDKError,
-    CLIConnectionError,
-    CLIJSONDecodeError,
-    CLINotFoundError,
-    Message,
-    ProcessError,
-    ResultMessage,
-    ToolUseBlock,
-    UserMessage,
-)
-from claude_agent_sdk._errors import MessageParseError
 
 from ..config.settings import Settings
 from .exceptions import (
@@ -38,12 +38,149 @@ from .exceptions import (
     ClaudeTimeoutError,
 )
 
+if TYPE_CHECKING:
+    from claude_agent_sdk import (
+        AssistantMessage,
+        Message,
+        TextBlock,
+        ThinkingBlock,
+        ToolUseBlock,
+        UserMessage,
+    )
+
 logger = structlog.get_logger()
 
+# Only the tail of the CLI's stderr is kept for error reports
+_STDERR_TAIL_LINES = 1000
+
+
+@functools.lru_cache(maxsize=None)
+def _stream_message_types() -> Tuple[
+    Type["AssistantMessage"],
+    Type["TextBlock"],
+    Type["ThinkingBlock"],
+    Type["ToolUseBlock"],
+    Type["UserMessage"],
+]:
+    """SDK classes _handle_stream_message dispatches on, imported once."""
+    from claude_agent_sdk import (
+        AssistantMessage,
+        TextBlock,
+        ThinkingBlock,
+        ToolUseBlock,
+        UserMessage,
+    )
+
+    return AssistantMessage, TextBlock, ThinkingBlock, ToolUseBlock, UserMessage
+
+
+_THINKING_MARKER = "ThinkingBlock("
+_THINKING_PREFIX = "thinking="
+_THINKING_SIGNATURE = ", signature="
+
+
+def _strip_thinking_blocks(text: str, keep_thinking: bool = False) -> str:
+    """Remove ``[ThinkingBlock(thinking=...)]`` reprs that leak into text.
+
+    With ``keep_thinking`` the wrapper (and any signature= suffix) is
+    unwrapped to the thinking text instead of dropped. A single linear scan
+    with str.find; the block ends at the first closing parenthesis.
+    """
+    parts: List[str] = []
+    pos = 0
+    while True:
+        start = text.find(_THINKING_MARKER, pos)
+        if start == -1:
+            break
+        body_start = start + len(_THINKING_MARKER)
+        end = text.find(")", body_start)
+        if end == -1:
+            break
+        if not text.startswith(_THINKING_PREFIX, body_start):
+            parts.append(text[pos:body_start])
+            pos = body_start
+            continue
+
+        cut_start = start - 1 if start > pos and text[start - 1] == "[" else start
+        cut_end = end + 2 if text.startswith("]", end + 1) else end + 1
+        parts.append(text[pos:cut_start])
+        if keep_thinking:
+            body = text[body_start + len(_THINKING_PREFIX) : end]
+            signature = body.find(_THINKING_SIGNATURE)
+            if signature != -1:
+                body = body[:signature]
+            if body[:1] in ("'", '"'):
+                body = body[1:]
+            if body[-1:] in ("'", '"'):
+                body = body[:-1]
+            parts.append(body)
+        pos = cut_end
+
+    if not parts:
+        return text
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
+# Resolved CLI locations keyed by the configured path. Only successful lookups
+# are cached, so a CLI installed after startup is still picked up.
+_cli_path_cache: Dict[Optional[str], str] = {}
+
+# Configured CLI paths whose directory is already on PATH in this process
+_path_patched_for: Set[Optional[str]] = set()
+
+# Parsed .env contents keyed on the resolved file path
+_env_file_cache: Dict[str, Dict[str, str]] = {}
+_env_file_lock = threading.Lock()
+
+
+def _parse_env_file(env_path: str) -> Dict[str, str]:
+    """Read non-empty KEY=value pairs from an env file."""
+    values: Dict[str, str] = {}
+    try:
+        # Iterate the file object: lines are read lazily, no full-file copy
+        with open(env_path, encoding="utf-8", errors="replace") as env_file:
+            for line in env_file:
+                if "=" not in line:
+                    continue
+                line = line.strip()
+                if line.startswith("#"):
+                    continue
+                k, _, v = line.partition("=")
+                k, v = k.strip(), v.strip()
+                if v and k not in values:
+                    values[k] = v
+    except OSError:
+        pass
+    return values
+
+
+# Env vars set by a parent Claude Code session that stop a child CLI starting
+_NESTING_VARS = ("CLAUDECODE", "CLAUDE_CODE")
+
+
+def _clear_nesting_vars() -> None:
+    """Unset Claude Code nesting guards, skipping the common clean case."""
+    environ = os.environ
+    for key in _NESTING_VARS:
+        if key in environ:
+            del environ[key]
+
 
 def find_claude_cli(claude_cli_path: Optional[str] = None) -> Optional[str]:
-    """Find Claude CLI in common locations."""
-    import glob
+    """Find Claude CLI in common locations (cached once found)."""
+    cached = _cli_path_cache.get(claude_cli_path)
+    if cached:
+        return cached
+
+    found = _locate_claude_cli(claude_cli_path)
+    if found:
+        _cli_path_cache[claude_cli_path] = found
+    return found
+
+
+def _locate_claude_cli(claude_cli_path: Optional[str]) -> Optional[str]:
+    """Search the config path, CLAUDE_CLI_PATH, PATH and install locations."""
     import shutil
 
     # First check if a specific path was provided via config or env
@@ -61,10 +198,17 @@ def find_claude_cli(claude_cli_path: Optional[str] = None) -> Optional[str]:
     if claude_path:
         return claude_path
 
+    # NVM installations: take the first node version that ships the CLI
+    nvm_root = os.path.expanduser("~/.nvm/versions/node")
+    if os.path.isdir(nvm_root):
+        with os.scandir(nvm_root) as entries:
+            for entry in entries:
+                candidate = os.path.join(entry.path, "bin", "claude")
+                if os.access(candidate, os.X_OK):
+                    return candidate
+
     # Check common installation locations
     common_paths = [
-        # NVM installations
-        os.path.expanduser("~/.nvm/versions/node/*/bin/claude"),
         # Direct npm global install
         os.path.expanduser("~/.npm-global/bin/claude"),
         os.path.expanduser("~/node_modules/.bin/claude"),
@@ -75,17 +219,18 @@ def find_claude_cli(claude_cli_path: Optional[str] = None) -> Optional[str]:
         os.path.expanduser("~/AppData/Roaming/npm/claude.cmd"),
     ]
 
-    for pattern in common_paths:
-        matches = glob.glob(pattern)
-        if matches:
-            # Return the first match
-            return matches[0]
+    for path in common_paths:
+        if os.access(path, os.X_OK):
+            return path
 
     return None
 
 
 def update_path_for_claude(claude_cli_path: Optional[str] = None) -> bool:
     """Update PATH to include Claude CLI if found."""
+    if claude_cli_path in _path_patched_for:
+        return True
+
     claude_path = find_claude_cli(claude_cli_path)
 
     if claude_path:
@@ -97,12 +242,13 @@ def update_path_for_claude(claude_cli_path: Optional[str] = None) -> bool:
             os.environ["PATH"] = f"{claude_dir}:{current_path}"
             logger.info("Updated PATH for Claude CLI", claude_path=claude_path)
 
+        _path_patched_for.add(claude_cli_path)
         return True
 
     return False
 
 
-@dataclass
+@dataclass(slots=True)
 class ClaudeResponse:
     """Response from Claude Code SDK."""
 
@@ -116,14 +262,14 @@ class ClaudeResponse:
     tools_used: List[Dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamUpdate:
     """Streaming update from Claude SDK."""
 
-    type: str  # 'assistant', 'user', 'system', 'result'
+    type: str  # 'assistant', 'thinking', 'user', 'system', 'result'
     content: Optional[str] = None
     tool_calls: Optional[List[Dict]] = None
-    metadata: Optional[Dict] = None
+    metadata: Optional[Dict] = None  # assistant updates may carry "thinking"
 
 
 class ClaudeSDKManager:
@@ -132,6 +278,7 @@ class ClaudeSDKManager:
     def __init__(self, config: Settings):
         """Initialize SDK manager with configuration."""
         self.config = config
+        self._mcp_config_cache: Dict[Path, Tuple[float, Dict[str, Any]]] = {}
 
         # Try to find and update PATH for Claude CLI
         if not update_path_for_claude(config.claude_cli_path):
@@ -142,13 +289,13 @@ class ClaudeSDKManager:
 
         # Unset env vars inherited from a parent Claude Code session that
         # would interfere with spawning a child Claude process.
-        os.environ.pop("CLAUDECODE", None)
+        _clear_nesting_vars()
         os.environ.pop("ANTHROPIC_API_KEY", None)
 
         # Set up environment for Claude Code SDK if API key is explicitly
         # provided in .env (not inherited from a parent session).
         # Read directly from .env to avoid picking up the parent session's key.
-        explicit_key = self._read_env_file_key("ANTHROPIC_API_KEY", config)
+        explicit_key = self._load_env_file().get("ANTHROPIC_API_KEY")
         if explicit_key:
             os.environ["ANTHROPIC_API_KEY"] = explicit_key
             logger.info("Using API key from .env for Claude SDK authentication")
@@ -162,22 +309,14 @@ class ClaudeSDKManager:
             )
 
     @staticmethod
-    def _read_env_file_key(key: str, config: Settings) -> Optional[str]:
-        """Read a key directly from the .env file, ignoring inherited env vars."""
-        env_path = Path(".env")
-        if not env_path.exists():
-            return None
-        try:
-            for line in env_path.read_text().splitlines():
-                line = line.strip()
-                if line.startswith("#") or "=" not in line:
-                    continue
-                k, _, v = line.partition("=")
-                if k.strip() == key and v.strip():
-                    return v.strip()
-        except OSError:
-            pass
-        return None
+    def _load_env_file() -> Dict[str, str]:
+        """Parse the .env file once, ignoring inherited env vars."""
+        env_path = str(Path(".env").resolve())
+        with _env_file_lock:
+            cached = _env_file_cache.get(env_path)
+            if cached is None:
+                cached = _env_file_cache[env_path] = _parse_env_file(env_path)
+        return cached
 
     async def execute_command(
         self,
@@ -192,12 +331,30 @@ class ClaudeSDKManager:
         reaction_callback: Optional[Callable[[Dict[str, Any]], Any]] = None,
     ) -> ClaudeResponse:
         """Execute Claude Code command via SDK."""
-        start_time = asyncio.get_event_loop().time()
+        # The SDK is imported on first use so importing this module for its
+        # helpers (find_claude_cli, StreamUpdate) stays cheap.
+        from claude_agent_sdk import (
+            AssistantMessage,
+            ClaudeAgentOptions,
+            ClaudeSDKClient,
+            ClaudeSDKError,
+            CLIConnectionError,
+            CLIJSONDecodeError,
+            CLINotFoundError,
+            ProcessError,
+            ResultMessage,
+            TextBlock,
+            ThinkingBlock,
+            ToolUseBlock,
+            UserMessage,
+        )
+        from claude_agent_sdk._errors import MessageParseError
+
+        start_time = time.monotonic()
 
         # Ensure nesting guard env vars are cleared before every subprocess
         # spawn (not just __init__), since the parent session may re-inject them.
-        os.environ.pop("CLAUDECODE", None)
-        os.environ.pop("CLAUDE_CODE", None)
+        _clear_nesting_vars()
 
         logger.info(
             "Starting Claude SDK command",
@@ -253,7 +410,7 @@ class ClaudeSDKManager:
                 )
 
             # Capture stderr from Claude CLI for debugging
-            stderr_lines: List[str] = []
+            stderr_lines: Deque[str] = deque(maxlen=_STDERR_TAIL_LINES)
 
             def _capture_stderr(line: str) -> None:
                 stderr_lines.append(line)
@@ -280,7 +437,7 @@ class ClaudeSDKManager:
             )
 
             # Register bot-specific tools as a real MCP server
-            from .mcp_tools import create_bot_mcp_server
+            from .mcp_tools import BOT_TOOL_NAMES, create_bot_mcp_server
 
             mcp_servers: Dict[str, Any] = {}
 
@@ -294,10 +451,19 @@ class ClaudeSDKManager:
 
             # Add bot tools MCP server (only if there are callbacks to wire up)
             if file_upload_callback or scheduler_callback or reaction_callback:
+                # Bot tools outside the allow list, or explicitly disallowed,
+                # are left out of the server so their schemas don't cost
+                # prompt tokens and BatchExecute can't reach them.
+                enabled_tools = BOT_TOOL_NAMES - set(
+                    self.config.claude_disallowed_tools or []
+                )
+                if self.config.claude_allowed_tools:
+                    enabled_tools &= set(self.config.claude_allowed_tools)
                 bot_server = create_bot_mcp_server(
                     file_upload_fn=file_upload_callback,
                     scheduler_fn=scheduler_callback,
                     reaction_fn=reaction_callback,
+                    enabled_tools=enabled_tools,
                 )
                 mcp_servers["slack-bot-tools"] = bot_server
 
@@ -313,7 +479,7 @@ class ClaudeSDKManager:
                 )
 
             # Collect messages via ClaudeSDKClient
-            messages: List[Message] = []
+            messages: List["Message"] = []
 
             async def _run_client() -> None:
                 async with ClaudeSDKClient(options) as client:
@@ -354,21 +520,58 @@ class ClaudeSDKManager:
                 timeout=self.config.claude_timeout_seconds,
             )
 
-            # Extract cost, tools, and session_id from result message
+            # Single pass over the conversation: result metadata, reply text
+            # (fallback for an empty ResultMessage.result), tools and turns.
             cost = 0.0
-            tools_used: List[Dict[str, Any]] = []
             claude_session_id = None
             result_content = None
+            has_result = False
+            content_parts: List[str] = []
+            tools_used: List[Dict[str, Any]] = []
+            num_turns = 0
+            current_time = time.monotonic()
+            add_text = content_parts.append
+            add_tool = tools_used.append
             for message in messages:
-                if isinstance(message, ResultMessage):
-                    cost = getattr(message, "total_cost_usd", 0.0) or 0.0
-                    claude_session_id = getattr(message, "session_id", None)
-                    result_content = getattr(message, "result", None)
-                    tools_used = self._extract_tools_from_messages(messages)
-                    break
+                if isinstance(message, AssistantMessage):
+                    num_turns += 1
+                    blocks = message.content
+                    if blocks and isinstance(blocks, list):
+                        for block in blocks:
+                            if isinstance(block, ToolUseBlock):
+                                add_tool(
+                                    {
+                                        "name": block.name,
+                                        "timestamp": current_time,
+                                        "input": block.input,
+                                    }
+                                )
+                            elif isinstance(block, TextBlock):
+                                add_text(block.text)
+                            # Thinking is shown in progress only, not in output
+                            elif isinstance(block, ThinkingBlock):
+                                continue
+                            elif getattr(block, "type", "") == "thinking":
+                                continue
+                            elif hasattr(block, "text"):
+                                add_text(block.text)
+                    elif blocks:
+                        # Fallback for non-list content
+                        add_text(str(blocks))
+                elif isinstance(message, UserMessage):
+                    num_turns += 1
+                elif isinstance(message, ResultMessage) and not has_result:
+                    has_result = True
+                    cost = message.total_cost_usd or 0.0
+                    claude_session_id = message.session_id
+                    result_content = message.result
+
+            # Tool usage is only reported for runs that reached a result
+            if not has_result:
+                tools_used = []
 
             # Calculate duration
-            duration_ms = int((asyncio.get_event_loop().time() - start_time) * 1000)
+            duration_ms = int((time.monotonic() - start_time) * 1000)
 
             # Use Claude's session_id if available, otherwise fall back
             final_session_id = claude_session_id or session_id or ""
@@ -384,11 +587,7 @@ class ClaudeSDKManager:
             # extraction.  With subscription/CLI auth the SDK may return
             # result="" (empty string) even though AssistantMessage objects
             # contain the actual response text.
-            content = (
-                result_content
-                if result_content
-                else self._extract_content_from_messages(messages)
-            )
+            content = result_content if result_content else "\n".join(content_parts)
 
             if not content:
                 logger.warning(
@@ -400,28 +599,15 @@ class ClaudeSDKManager:
 
             # Clean ThinkingBlock wrapper remnants from final content
             # (thinking is shown in progress, not in final output)
-            if content and "ThinkingBlock(" in content:
-                import re as _re
-
-                content = _re.sub(
-                    r"\[?ThinkingBlock\(thinking=['\"]?(.*?)['\"]?\)\]?",
-                    "",
-                    content,
-                    flags=_re.DOTALL,
-                ).strip()
+            if content and _THINKING_MARKER in content:
+                content = _strip_thinking_blocks(content).strip()
 
             return ClaudeResponse(
                 content=content,
                 session_id=final_session_id,
                 cost=cost,
                 duration_ms=duration_ms,
-                num_turns=len(
-                    [
-                        m
-                        for m in messages
-                        if isinstance(m, (UserMessage, AssistantMessage))
-                    ]
-                ),
+                num_turns=num_turns,
                 tools_used=tools_used,
             )
 
@@ -480,89 +666,87 @@ class ClaudeSDKManager:
 
         except Exception as e:
             # Handle ExceptionGroup from TaskGroup operations (Python 3.11+)
-            if type(e).__name__ == "ExceptionGroup" or hasattr(e, "exceptions"):
+            if isinstance(e, BaseExceptionGroup):
                 logger.error(
                     "Task group error in Claude SDK",
                     error=str(e),
                     error_type=type(e).__name__,
-                    exception_count=len(getattr(e, "exceptions", [])),
-                    exceptions=[
-                        str(ex) for ex in getattr(e, "exceptions", [])[:3]
-                    ],  # Log first 3 exceptions
+                    exception_count=len(e.exceptions),
+                    exceptions=[str(ex) for ex in e.exceptions[:3]],  # First 3
                 )
                 # Extract the most relevant exception from the group
-                exceptions = getattr(e, "exceptions", [e])
-                main_exception = exceptions[0] if exceptions else e
+                main_exception = e.exceptions[0] if e.exceptions else e
                 raise ClaudeProcessError(
                     f"Claude SDK task error: {str(main_exception)}"
                 )
 
-            # Check if it's an ExceptionGroup disguised as a regular exception
-            elif hasattr(e, "__notes__") and "TaskGroup" in str(e):
-                logger.error(
-                    "TaskGroup related error in Claude SDK",
-                    error=str(e),
-                    error_type=type(e).__name__,
-                )
-                raise ClaudeProcessError(f"Claude SDK task error: {str(e)}")
-
-            else:
-                logger.error(
-                    "Unexpected error in Claude SDK",
-                    error=str(e),
-                    error_type=type(e).__name__,
-                )
-                raise ClaudeProcessError(f"Unexpected error: {str(e)}")
+            logger.error(
+                "Unexpected error in Claude SDK",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise ClaudeProcessError(f"Unexpected error: {str(e)}")
 
     async def _handle_stream_message(
-        self, message: Message, stream_callback: Callable[[StreamUpdate], None]
+        self, message: "Message", stream_callback: Callable[[StreamUpdate], None]
     ) -> None:
         """Handle streaming message from claude-agent-sdk."""
+        (
+            AssistantMessage,
+            TextBlock,
+            ThinkingBlock,
+            ToolUseBlock,
+            UserMessage,
+        ) = _stream_message_types()
+
         try:
             if isinstance(message, AssistantMessage):
                 # Extract content from assistant message
-                content = getattr(message, "content", [])
+                content = message.content
                 text_parts = []
                 tool_calls = []
+                thinking_parts = []
 
                 if content and isinstance(content, list):
-                    thinking_parts = []
                     for block in content:
-                        block_type = getattr(block, "type", "")
-                        if block_type == "thinking":
-                            # Extract clean thinking text
-                            thinking_text = getattr(block, "thinking", None) or getattr(
-                                block, "text", None
-                            )
-                            if thinking_text:
-                                thinking_parts.append(thinking_text)
-                            continue
                         if isinstance(block, ToolUseBlock):
                             tool_calls.append(
                                 {
-                                    "name": getattr(block, "name", "unknown"),
-                                    "input": getattr(block, "input", {}),
-                                    "id": getattr(block, "id", None),
+                                    "name": block.name,
+                                    "input": block.input,
+                                    "id": block.id,
                                 }
                             )
+                        elif isinstance(block, TextBlock):
+                            text_parts.append(block.text)
+                        elif isinstance(block, ThinkingBlock):
+                            if block.thinking:
+                                thinking_parts.append(block.thinking)
+                        elif getattr(block, "type", "") == "thinking":
+                            # Duck-typed thinking block from other SDK versions
+                            thinking_text = getattr(block, "thinking", None) or getattr(
+                                block, "text", None
+                            )
+                            if thinking_text:
+                                thinking_parts.append(thinking_text)
                         elif hasattr(block, "text"):
                             text_parts.append(block.text)
 
-                    # Send thinking as a separate stream update
-                    if thinking_parts and stream_callback:
-                        thinking_update = StreamUpdate(
-                            type="thinking",
-                            content="\n".join(thinking_parts),
-                        )
-                        await stream_callback(thinking_update)
-
+                thinking = "\n".join(thinking_parts) if thinking_parts else None
                 if text_parts or tool_calls:
+                    # One update per message: thinking rides along in
+                    # metadata instead of costing a second callback.
                     update = StreamUpdate(
                         type="assistant",
                         content=("\n".join(text_parts) if text_parts else None),
                         tool_calls=tool_calls if tool_calls else None,
+                        metadata={"thinking": thinking} if thinking else None,
                     )
                     await stream_callback(update)
+                elif thinking:
+                    await stream_callback(
+                        StreamUpdate(type="thinking", content=thinking)
+                    )
                 elif content and not isinstance(content, list):
                     # Fallback only for non-list content. If content is a list,
                     # the loop above already emitted clean thinking/text/tool
@@ -572,14 +756,11 @@ class ClaudeSDKManager:
                     content_str = str(content)
                     # Strip ThinkingBlock wrapper if the SDK ever hands us one
                     # as a bare string; tolerate optional signature= suffix.
-                    import re as _re
-
-                    content_str = _re.sub(
-                        r"\[?ThinkingBlock\(thinking=['\"]?(.*?)['\"]?"
-                        r"(?:,\s*signature=['\"][^'\"]*['\"])?\)\]?",
-                        r"\1",
-                        content_str,
-                    ).strip()
+                    if _THINKING_MARKER in content_str:
+                        content_str = _strip_thinking_blocks(
+                            content_str, keep_thinking=True
+                        )
+                    content_str = content_str.strip()
                     if content_str:
                         update = StreamUpdate(
                             type="assistant",
@@ -588,67 +769,33 @@ class ClaudeSDKManager:
                         await stream_callback(update)
 
             elif isinstance(message, UserMessage):
-                content = getattr(message, "content", "")
-                if content:
+                user_content = message.content
+                if user_content:
                     update = StreamUpdate(
                         type="user",
-                        content=content,
+                        content=user_content,
                     )
                     await stream_callback(update)
 
         except Exception as e:
             logger.warning("Stream callback failed", error=str(e))
 
-    def _extract_content_from_messages(self, messages: List[Message]) -> str:
-        """Extract content from message list."""
-        content_parts = []
+    def _build_system_prompt(self, working_directory: Path) -> str:
+        """Build system prompt with context about the bot environment."""
+        prompt = self._base_system_prompt(str(working_directory))
 
-        for message in messages:
-            if isinstance(message, AssistantMessage):
-                content = getattr(message, "content", [])
-                if content and isinstance(content, list):
-                    for block in content:
-                        block_type = getattr(block, "type", "")
-                        # Skip tool use blocks — they're tracked separately
-                        if isinstance(block, ToolUseBlock):
-                            continue
-                        # Skip thinking blocks from final output (shown in progress only)
-                        if block_type == "thinking":
-                            continue
-                        if hasattr(block, "text"):
-                            content_parts.append(block.text)
-                elif content:
-                    # Fallback for non-list content
-                    content_parts.append(str(content))
-
-        return "\n".join(content_parts)
-
-    def _extract_tools_from_messages(
-        self, messages: List[Message]
-    ) -> List[Dict[str, Any]]:
-        """Extract tools used from message list."""
-        tools_used = []
-        current_time = asyncio.get_event_loop().time()
-
-        for message in messages:
-            if isinstance(message, AssistantMessage):
-                content = getattr(message, "content", [])
-                if content and isinstance(content, list):
-                    for block in content:
-                        if isinstance(block, ToolUseBlock):
-                            tools_used.append(
-                                {
-                                    "name": getattr(block, "name", "unknown"),
-                                    "timestamp": current_time,
-                                    "input": getattr(block, "input", {}),
-                                }
-                            )
+        # Append custom emoji context if config exists
+        emoji_context = self._load_emoji_config(working_directory)
+        if emoji_context:
+            prompt += "\n\n" + emoji_context
 
-        return tools_used
+        return prompt
 
-    def _build_system_prompt(self, working_directory: Path) -> str:
-        """Build system prompt with context about the bot environment."""
-        prompt = (
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _base_system_prompt(working_directory: str) -> str:
+        """Fixed part of the system prompt; depends only on the directory."""
+        return (
             f"All file operations must stay within {working_directory}. "
             "Use relative paths.\n\n"
             "IMPORTANT: You are running as a Slack bot agent. "
@@ -667,13 +814,6 @@ class ClaudeSDKManager:
             "or expressing empathy. Keep it natural and sparing."
         )
 
-        # Append custom emoji context if config exists
-        emoji_context = self._load_emoji_config(working_directory)
-        if emoji_context:
-            prompt += "\n\n" + emoji_context
-
-        return prompt
-
     def _load_emoji_config(self, working_directory: Path) -> str:
         """Load custom emoji definitions from config/emoji.yaml."""
         import yaml
@@ -708,14 +848,27 @@ class ClaudeSDKManager:
         """Load MCP server configuration from a JSON file.
 
         The new claude-agent-sdk expects mcp_servers as a dict, not a file path.
+        The parsed servers are cached until the file's mtime changes; callers
+        get a shallow copy they may add servers to.
         """
         import json
 
         try:
-            with open(config_path) as f:
-                config_data = json.load(f)
-            return config_data.get("mcpServers", {})
-        except (json.JSONDecodeError, OSError) as e:
+            import orjson
+
+            loads: Callable[[bytes], Any] = orjson.loads
+        except ImportError:
+            loads = json.loads
+
+        try:
+            mtime = config_path.stat().st_mtime
+            cached = self._mcp_config_cache.get(config_path)
+            if cached is None or cached[0] != mtime:
+                config_data = loads(config_path.read_bytes())
+                cached = (mtime, config_data.get("mcpServers", {}))
+                self._mcp_config_cache[config_path] = cached
+            return dict(cached[1])
+        except (ValueError, OSError) as e:
             logger.error(
                 "Failed to load MCP config", path=str(config_path), error=str(e)
             )
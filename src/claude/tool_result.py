@@ -0,0 +1,65 @@
+"""Result and argument types shared by the bot's MCP tool callbacks.
+
+Kept free of claude_agent_sdk imports so the callbacks (in the orchestrator)
+can be defined without loading the SDK, e.g. when running the CLI backend.
+The JSON schemas the argument dicts mirror live in mcp_tools.
+"""
+
+from typing import Any, Dict, List, NamedTuple, Required, TypedDict
+
+
+class ToolResult(NamedTuple):
+    """Outcome of a bot tool callback.
+
+    Callbacks report failure explicitly instead of the tool wrappers sniffing
+    the message text for an "Error" prefix.
+    """
+
+    text: str
+    is_error: bool = False
+
+
+class FileUploadArgs(TypedDict, total=False):
+    """SlackFileUpload input (see _FILE_UPLOAD_SCHEMA)."""
+
+    file_path: Required[str]
+    filename: str
+    title: str
+    comment: str
+
+
+class ReactionArgs(TypedDict, total=False):
+    """SlackReaction input (see _REACTION_SCHEMA)."""
+
+    emoji_name: Required[str]
+    remove: bool
+
+
+class ScheduleJobArgs(TypedDict, total=False):
+    """ScheduleJob input (see _SCHEDULE_JOB_SCHEMA)."""
+
+    job_name: Required[str]
+    cron_expression: Required[str]
+    prompt: Required[str]
+    skill_name: str
+
+
+class RemoveJobArgs(TypedDict):
+    """RemoveScheduledJob input (see _REMOVE_JOB_SCHEMA)."""
+
+    job_id: str
+
+
+class BatchCall(TypedDict, total=False):
+    """One entry of BatchExecute's ``calls`` list."""
+
+    tool_name: Required[str]
+    arguments: Dict[str, Any]
+
+
+class BatchExecuteArgs(TypedDict, total=False):
+    """BatchExecute input (see _BATCH_SCHEMA)."""
+
+    calls: Required[List[BatchCall]]
+    stop_on_error: bool
+    max_concurrent: int
@@ -12,7 +12,7 @@ import json
 from pathlib import Path
 from typing import Any, List, Optional
 
-from pydantic import Field, SecretStr, field_validator, model_validator
+from pydantic import Field, SecretStr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from src.utils.constants import (
@@ -27,6 +27,31 @@ from src.utils.constants import (
     DEFAULT_SESSION_TIMEOUT_HOURS,
 )
 
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_VALID_LOG_LEVELS = frozenset(_LOG_LEVELS)
+
+
+def _check_mcp_config_file(path: Path) -> None:
+    """Ensure an MCP config file holds a non-empty ``mcpServers`` object."""
+    try:
+        with open(path) as f:
+            config_data = json.load(f)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"MCP config file is not valid JSON: {e}")
+    if not isinstance(config_data, dict):
+        raise ValueError("MCP config file must contain a JSON object")
+    if "mcpServers" not in config_data:
+        raise ValueError(
+            "MCP config file must contain a 'mcpServers' key. "
+            'Format: {"mcpServers": {"name": {"command": ...}}}'
+        )
+    if not isinstance(config_data["mcpServers"], dict):
+        raise ValueError(
+            "'mcpServers' must be an object mapping server names to configurations"
+        )
+    if not config_data["mcpServers"]:
+        raise ValueError("'mcpServers' must contain at least one server configuration")
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -127,8 +152,10 @@ class Settings(BaseSettings):
             "ScheduleJob",
             "ListScheduledJobs",
             "RemoveScheduledJob",
+            "SchedulerHelp",
             "SlackFileUpload",
             "SlackReaction",
+            "BatchExecute",
         ],
         description="List of allowed Claude tools",
     )
@@ -240,28 +267,21 @@ class Settings(BaseSettings):
         env_file=".env", env_file_encoding="utf-8", case_sensitive=False, extra="ignore"
     )
 
-    @field_validator("allowed_users", "notification_channel_ids", mode="before")
+    @field_validator(
+        "allowed_users",
+        "notification_channel_ids",
+        "claude_allowed_tools",
+        mode="before",
+    )
     @classmethod
     def parse_str_list(cls, v: Any) -> Optional[List[str]]:
-        """Parse comma-separated string lists."""
-        if v is None:
-            return None
-        if isinstance(v, str):
-            return [uid.strip() for uid in v.split(",") if uid.strip()]
-        if isinstance(v, list):
-            return [str(uid) for uid in v]
-        return v  # type: ignore[no-any-return]
-
-    @field_validator("claude_allowed_tools", mode="before")
-    @classmethod
-    def parse_claude_allowed_tools(cls, v: Any) -> Optional[List[str]]:
-        """Parse comma-separated tool names."""
+        """Parse comma-separated string lists (user IDs, channels, tools)."""
         if v is None:
             return None
         if isinstance(v, str):
-            return [tool.strip() for tool in v.split(",") if tool.strip()]
+            return [item for item in map(str.strip, v.split(",")) if item]
         if isinstance(v, list):
-            return [str(tool) for tool in v]
+            return [str(item) for item in v]
         return v  # type: ignore[no-any-return]
 
     @field_validator("approved_directory")
@@ -288,26 +308,7 @@ class Settings(BaseSettings):
             v = Path(v)
         if not v.exists():
             raise ValueError(f"MCP config file does not exist: {v}")
-        try:
-            with open(v) as f:
-                config_data = json.load(f)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"MCP config file is not valid JSON: {e}")
-        if not isinstance(config_data, dict):
-            raise ValueError("MCP config file must contain a JSON object")
-        if "mcpServers" not in config_data:
-            raise ValueError(
-                "MCP config file must contain a 'mcpServers' key. "
-                'Format: {"mcpServers": {"name": {"command": ...}}}'
-            )
-        if not isinstance(config_data["mcpServers"], dict):
-            raise ValueError(
-                "'mcpServers' must be an object mapping server names to configurations"
-            )
-        if not config_data["mcpServers"]:
-            raise ValueError(
-                "'mcpServers' must contain at least one server configuration"
-            )
+        # Contents are only parsed when MCP is enabled; see model_post_init.
         return v  # type: ignore[no-any-return]
 
     @field_validator("projects_config_path", mode="before")
@@ -331,14 +332,17 @@ class Settings(BaseSettings):
     @classmethod
     def validate_log_level(cls, v: Any) -> str:
         """Validate log level."""
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if v.upper() not in valid_levels:
-            raise ValueError(f"log_level must be one of {valid_levels}")
-        return v.upper()  # type: ignore[no-any-return]
-
-    @model_validator(mode="after")
-    def validate_cross_field_dependencies(self) -> "Settings":
-        """Validate dependencies between fields."""
+        level = v.upper()
+        if level not in _VALID_LOG_LEVELS:
+            raise ValueError(f"log_level must be one of {list(_LOG_LEVELS)}")
+        return level  # type: ignore[no-any-return]
+
+    def model_post_init(self, __context: Any) -> None:
+        """Validate dependencies between fields.
+
+        Runs once field validation is done; a ValueError here still surfaces
+        as a ValidationError.
+        """
         # Check auth token requirements
         if self.enable_token_auth and not self.auth_token_secret:
             raise ValueError(
@@ -346,8 +350,10 @@ class Settings(BaseSettings):
             )
 
         # Check MCP requirements
-        if self.enable_mcp and not self.mcp_config_path:
-            raise ValueError("mcp_config_path required when enable_mcp is True")
+        if self.enable_mcp:
+            if not self.mcp_config_path:
+                raise ValueError("mcp_config_path required when enable_mcp is True")
+            _check_mcp_config_file(self.mcp_config_path)
 
         if self.enable_project_channels:
             if not self.projects_config_path:
@@ -355,8 +361,6 @@ class Settings(BaseSettings):
                     "projects_config_path required when enable_project_channels is True"
                 )
 
-        return self
-
     @property
     def is_production(self) -> bool:
         """Check if running in production mode."""
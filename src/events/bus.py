@@ -16,7 +16,7 @@ import structlog
 logger = structlog.get_logger()
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """Base event class. All events carry an ID, timestamp, and source."""
 
@@ -3,8 +3,9 @@
 AgentHandler: translates events into ClaudeIntegration.run_command() calls.
 """
 
+import asyncio
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import structlog
 
@@ -14,6 +15,9 @@ from .types import AgentResponseEvent, ScheduledEvent, WebhookEvent
 
 logger = structlog.get_logger()
 
+# Payload summaries are cut off at this length before going into the prompt
+_SUMMARY_MAX_CHARS = 2000
+
 
 class AgentHandler:
     """Translates incoming events into Claude agent executions.
@@ -31,6 +35,7 @@ class AgentHandler:
         default_user_id: str = "",
         slack_client: Any = None,
         orchestrator: Any = None,
+        notification_channel_ids: Optional[List[str]] = None,
     ) -> None:
         self.event_bus = event_bus
         self.claude = claude_integration
@@ -38,6 +43,11 @@ class AgentHandler:
         self.default_user_id = default_user_id
         self.slack_client = slack_client
         self.orchestrator = orchestrator
+        # Webhook results only go to the notification channels; with an
+        # explicitly empty list there is nowhere to deliver them.
+        self._has_notification_sink = notification_channel_ids is None or bool(
+            notification_channel_ids
+        )
 
     def register(self) -> None:
         """Subscribe to events that need agent processing."""
@@ -49,6 +59,14 @@ class AgentHandler:
         if not isinstance(event, WebhookEvent):
             return
 
+        if not self._has_notification_sink:
+            logger.debug(
+                "Dropping webhook event, no notification channels configured",
+                provider=event.provider,
+                delivery_id=event.delivery_id,
+            )
+            return
+
         logger.info(
             "Processing webhook event through agent",
             provider=event.provider,
@@ -98,6 +116,9 @@ class AgentHandler:
             job_name=event.job_name,
         )
 
+        # A job listing a channel twice must not run Claude twice for it
+        channels = list(dict.fromkeys(event.target_channel_ids))
+
         prompt = event.prompt
         if event.skill_name:
             prompt = (
@@ -106,21 +127,14 @@ class AgentHandler:
 
         # Route through orchestrator if available — this shares the channel's
         # session so the job and user conversation have mutual context.
-        if self.orchestrator and self.slack_client and event.target_channel_ids:
-            for channel_id in event.target_channel_ids:
-                try:
-                    await self.orchestrator.run_scheduled_prompt(
-                        prompt=prompt,
-                        channel_id=channel_id,
-                        user_id=self.default_user_id,
-                        client=self.slack_client,
-                    )
-                except Exception:
-                    logger.exception(
-                        "Orchestrator scheduled execution failed",
-                        job_name=event.job_name,
-                        channel_id=channel_id,
-                    )
+        # Channels are independent, so their runs proceed concurrently.
+        if self.orchestrator and self.slack_client and channels:
+            await asyncio.gather(
+                *(
+                    self._run_scheduled_in_channel(prompt, channel_id, event.job_name)
+                    for channel_id in channels
+                )
+            )
             return
 
         # Fallback: standalone execution (no shared session context)
@@ -134,21 +148,15 @@ class AgentHandler:
             )
 
             if response.content:
-                for channel_id in event.target_channel_ids:
+                # An empty channel_id broadcasts to the notification channels
+                text = response.content
+                origin_id = event.id
+                for channel_id in channels or [""]:
                     await self.event_bus.publish(
                         AgentResponseEvent(
                             channel_id=channel_id,
-                            text=response.content,
-                            originating_event_id=event.id,
-                        )
-                    )
-
-                if not event.target_channel_ids:
-                    await self.event_bus.publish(
-                        AgentResponseEvent(
-                            channel_id="",
-                            text=response.content,
-                            originating_event_id=event.id,
+                            text=text,
+                            originating_event_id=origin_id,
                         )
                     )
         except Exception:
@@ -158,6 +166,24 @@ class AgentHandler:
                 event_id=event.id,
             )
 
+    async def _run_scheduled_in_channel(
+        self, prompt: str, channel_id: str, job_name: str
+    ) -> None:
+        """Run a scheduled prompt in one channel's session, logging failures."""
+        try:
+            await self.orchestrator.run_scheduled_prompt(
+                prompt=prompt,
+                channel_id=channel_id,
+                user_id=self.default_user_id,
+                client=self.slack_client,
+            )
+        except Exception:
+            logger.exception(
+                "Orchestrator scheduled execution failed",
+                job_name=job_name,
+                channel_id=channel_id,
+            )
+
     def _build_webhook_prompt(self, event: WebhookEvent) -> str:
         """Build a Claude prompt from a webhook event."""
         payload_summary = self._summarize_payload(event.payload)
@@ -172,39 +198,58 @@ class AgentHandler:
 
     def _summarize_payload(self, payload: Dict[str, Any], max_depth: int = 2) -> str:
         """Create a readable summary of a webhook payload."""
-        lines: List[str] = []
-        self._flatten_dict(payload, lines, max_depth=max_depth)
+        lines = self._flatten_dict(
+            payload, max_depth=max_depth, max_chars=_SUMMARY_MAX_CHARS
+        )
         summary = "\n".join(lines)
-        if len(summary) > 2000:
-            summary = summary[:2000] + "\n... (truncated)"
+        if len(summary) > _SUMMARY_MAX_CHARS:
+            summary = summary[:_SUMMARY_MAX_CHARS] + "\n... (truncated)"
         return summary
 
     def _flatten_dict(
         self,
         data: Any,
-        lines: list,
-        prefix: str = "",
-        depth: int = 0,
         max_depth: int = 2,
-    ) -> None:
-        """Flatten a nested dict into key: value lines."""
-        if depth >= max_depth:
-            lines.append(f"{prefix}: ...")
-            return
+        max_chars: Optional[int] = None,
+    ) -> List[str]:
+        """Flatten a nested dict into key: value lines.
 
-        if isinstance(data, dict):
-            for key, value in data.items():
-                full_key = f"{prefix}.{key}" if prefix else key
-                if isinstance(value, (dict, list)):
-                    self._flatten_dict(value, lines, full_key, depth + 1, max_depth)
+        Walks depth-first with an explicit stack and stops as soon as the
+        joined lines would exceed ``max_chars``.
+        """
+        lines: List[str] = []
+        total = -1  # no separator before the first line
+        # Entries are either a finished line or a (data, prefix, depth) node
+        stack: List[Any] = [(data, "", 0)]
+        while stack:
+            entry = stack.pop()
+            if type(entry) is str:
+                line = entry
+            else:
+                node, prefix, depth = entry
+                node_type = type(node)
+                if depth >= max_depth:
+                    line = f"{prefix}: ..."
+                elif node_type is dict:
+                    for key, value in reversed(node.items()):
+                        full_key = f"{prefix}.{key}" if prefix else key
+                        if type(value) in (dict, list):
+                            stack.append((value, full_key, depth + 1))
+                        else:
+                            val_str = str(value)
+                            if len(val_str) > 200:
+                                val_str = val_str[:200] + "..."
+                            stack.append(f"{full_key}: {val_str}")
+                    continue
+                elif node_type is list:
+                    line = f"{prefix}: [{len(node)} items]"
+                    for i in range(min(len(node), 3) - 1, -1, -1):
+                        stack.append((node[i], f"{prefix}[{i}]", depth + 1))
                 else:
-                    val_str = str(value)
-                    if len(val_str) > 200:
-                        val_str = val_str[:200] + "..."
-                    lines.append(f"{full_key}: {val_str}")
-        elif isinstance(data, list):
-            lines.append(f"{prefix}: [{len(data)} items]")
-            for i, item in enumerate(data[:3]):
-                self._flatten_dict(item, lines, f"{prefix}[{i}]", depth + 1, max_depth)
-        else:
-            lines.append(f"{prefix}: {data}")
+                    line = f"{prefix}: {node}"
+
+            lines.append(line)
+            total += len(line) + 1
+            if max_chars is not None and total > max_chars:
+                break
+        return lines
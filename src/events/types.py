@@ -1,24 +1,28 @@
 """Concrete event types for the event bus."""
 
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Final, List, Optional
 
 from .bus import Event
 
+# Paths are immutable, so every event can share one default instance
+_DEFAULT_CWD: Final = Path(".")
 
-@dataclass
+
+@dataclass(slots=True)
 class UserMessageEvent(Event):
     """A message from a Slack user."""
 
     user_id: str = ""
     channel_id: str = ""
     text: str = ""
-    working_directory: Path = field(default_factory=lambda: Path("."))
+    working_directory: Path = _DEFAULT_CWD
     source: str = "slack"
 
 
-@dataclass
+@dataclass(slots=True)
 class WebhookEvent(Event):
     """An external webhook delivery (GitHub, Notion, etc.)."""
 
@@ -28,21 +32,30 @@ class WebhookEvent(Event):
     delivery_id: str = ""
     source: str = "webhook"
 
+    def __post_init__(self) -> None:
+        # Provider/type names repeat across deliveries; intern them so
+        # comparisons and dict lookups hit the identity fast path.
+        self.provider = sys.intern(self.provider)
+        self.event_type_name = sys.intern(self.event_type_name)
+
 
-@dataclass
+@dataclass(slots=True)
 class ScheduledEvent(Event):
     """A cron/scheduled trigger."""
 
     job_id: str = ""
     job_name: str = ""
     prompt: str = ""
-    working_directory: Path = field(default_factory=lambda: Path("."))
+    working_directory: Path = _DEFAULT_CWD
     target_channel_ids: List[str] = field(default_factory=list)
     skill_name: Optional[str] = None
     source: str = "scheduler"
 
+    def __post_init__(self) -> None:
+        self.job_name = sys.intern(self.job_name)
+
 
-@dataclass
+@dataclass(slots=True)
 class AgentResponseEvent(Event):
     """An agent has produced a response to deliver."""
 
@@ -6,9 +6,11 @@ import logging
 import os
 import signal
 import sys
+import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
+import aiohttp
 import structlog
 from slack_sdk.web.async_client import AsyncWebClient
 
@@ -19,7 +21,6 @@ from src.claude import (
     SessionManager,
     ToolMonitor,
 )
-from src.claude.sdk_integration import ClaudeSDKManager
 from src.config.features import FeatureFlags
 from src.config.settings import Settings
 from src.events.bus import EventBus
@@ -27,7 +28,11 @@ from src.events.handlers import AgentHandler
 from src.events.middleware import EventSecurityMiddleware
 from src.exceptions import ConfigurationError
 from src.notifications.service import NotificationService
-from src.projects import load_project_registry
+from src.projects import (
+    ProjectChannelManager,
+    ProjectRegistry,
+    load_project_registry,
+)
 from src.scheduler.scheduler import JobScheduler
 from src.security.audit import AuditLogger, InMemoryAuditStorage
 from src.security.auth import (
@@ -41,6 +46,23 @@ from src.security.validators import SecurityValidator
 from src.storage.facade import Storage
 from src.storage.session_storage import SQLiteSessionStorage
 
+logger = structlog.get_logger()
+
+
+def _json_renderer() -> structlog.processors.JSONRenderer:
+    """Build the production JSON renderer, backed by orjson when installed."""
+    try:
+        import orjson
+    except ImportError:
+        return structlog.processors.JSONRenderer()
+
+    def dumps(obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(
+            obj, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+
+    return structlog.processors.JSONRenderer(serializer=dumps)
+
 
 def setup_logging(debug: bool = False) -> None:
     """Configure structured logging."""
@@ -62,11 +84,7 @@ def setup_logging(debug: bool = False) -> None:
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            (
-                structlog.processors.JSONRenderer()
-                if not debug
-                else structlog.dev.ConsoleRenderer()
-            ),
+            _json_renderer() if not debug else structlog.dev.ConsoleRenderer(),
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
@@ -95,7 +113,6 @@ def parse_args() -> argparse.Namespace:
 
 async def create_application(config: Settings) -> Dict[str, Any]:
     """Create and configure the application components."""
-    logger = structlog.get_logger()
     logger.info("Creating application components")
 
     features = FeatureFlags(config)
@@ -142,7 +159,9 @@ async def create_application(config: Settings) -> Dict[str, Any]:
     )
 
     # Create Claude backend based on configuration
-    if getattr(config, "use_sdk", True):
+    if config.use_sdk:
+        from src.claude.sdk_integration import ClaudeSDKManager
+
         logger.info("Using Claude Python SDK integration")
         sdk_manager = ClaudeSDKManager(config)
         claude_integration = ClaudeIntegration(
@@ -188,10 +207,16 @@ async def create_application(config: Settings) -> Dict[str, Any]:
 
     bot = ClaudeCodeBot(config, dependencies)
 
-    # Create agent handler with orchestrator reference for shared sessions
-    from slack_sdk.web.async_client import AsyncWebClient
+    # One Web API client (and connection pool) for agent handler,
+    # notifications and project channel management
+    slack_client = AsyncWebClient(
+        token=config.slack_bot_token_str,
+        session=aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+        ),
+    )
 
-    slack_client = AsyncWebClient(token=config.slack_bot_token_str)
+    # Create agent handler with orchestrator reference for shared sessions
     agent_handler = AgentHandler(
         event_bus=event_bus,
         claude_integration=claude_integration,
@@ -199,6 +224,7 @@ async def create_application(config: Settings) -> Dict[str, Any]:
         default_user_id=config.allowed_users[0] if config.allowed_users else "",
         slack_client=slack_client,
         orchestrator=bot.orchestrator,
+        notification_channel_ids=config.notification_channel_ids or [],
     )
     agent_handler.register()
 
@@ -212,6 +238,7 @@ async def create_application(config: Settings) -> Dict[str, Any]:
         "features": features,
         "event_bus": event_bus,
         "agent_handler": agent_handler,
+        "slack_client": slack_client,
         "auth_manager": auth_manager,
         "security_validator": security_validator,
     }
@@ -219,47 +246,54 @@ async def create_application(config: Settings) -> Dict[str, Any]:
 
 async def run_application(app: Dict[str, Any]) -> None:
     """Run the application with graceful shutdown handling."""
-    logger = structlog.get_logger()
     bot: ClaudeCodeBot = app["bot"]
     claude_integration: ClaudeIntegration = app["claude_integration"]
     storage: Storage = app["storage"]
     config: Settings = app["config"]
     features: FeatureFlags = app["features"]
     event_bus: EventBus = app["event_bus"]
+    slack_client: AsyncWebClient = app["slack_client"]
 
     notification_service: Optional[NotificationService] = None
     scheduler: Optional[JobScheduler] = None
 
     shutdown_event = asyncio.Event()
 
-    def signal_handler(signum: int, frame: Any) -> None:
+    def request_shutdown(signum: int) -> None:
         logger.info("Shutdown signal received", signal=signum)
         shutdown_event.set()
 
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    # Deliver signals through the event loop; Windows loops lack support
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, request_shutdown, signum)
+        except NotImplementedError:
+            signal.signal(signum, lambda sig, frame: request_shutdown(sig))
 
     try:
         logger.info("Starting Claude Code Slack Bot")
 
-        # Initialize the bot first (creates the Slack Bolt App)
-        await bot.initialize()
-
-        # Create Slack WebClient (shared for notifications + channel management)
-        slack_client = AsyncWebClient(token=config.slack_bot_token_str)
-
+        # Initialize the bot (creates the Slack Bolt App). Project definitions
+        # are parsed in a worker thread meanwhile.
+        registry: Optional[ProjectRegistry] = None
         if config.enable_project_channels:
             if not config.projects_config_path:
                 raise ConfigurationError(
                     "Project channel mode enabled but required settings are missing"
                 )
-            registry = load_project_registry(
-                config_path=config.projects_config_path,
-                approved_directory=config.approved_directory,
+            registry, _ = await asyncio.gather(
+                asyncio.to_thread(
+                    load_project_registry,
+                    config_path=config.projects_config_path,
+                    approved_directory=config.approved_directory,
+                ),
+                bot.initialize(),
             )
+        else:
+            await bot.initialize()
 
-            from src.projects import ProjectChannelManager
-
+        if registry is not None:
             channel_manager = ProjectChannelManager(
                 registry=registry,
                 repository=storage.project_threads,
@@ -385,6 +419,32 @@ PIDFILE = Path("data/bot.pid")
 RESTART_SENTINEL = Path("data/restart_requested")
 
 
+def _is_bot_cmdline(argv: List[str]) -> bool:
+    """Check whether a command line launches this bot.
+
+    Covers the ``claude-slack-bot`` console script and ``python -m src.main``
+    (or ``python src/main.py``).
+    """
+    return any(
+        arg == "src.main"
+        or arg.endswith("src/main.py")
+        or os.path.basename(arg) == "claude-slack-bot"
+        for arg in argv
+    )
+
+
+def _is_bot_process(pid: int) -> bool:
+    """Check that ``pid`` is this bot rather than a process reusing the PID.
+
+    Uses /proc on Linux; elsewhere the PID file is trusted as before.
+    """
+    try:
+        cmdline = Path(f"/proc/{pid}/cmdline").read_bytes()
+    except OSError:
+        return True
+    return _is_bot_cmdline(cmdline.decode(errors="replace").split("\0"))
+
+
 def _acquire_pidfile() -> None:
     """Kill any existing bot instance and write our PID.
 
@@ -396,11 +456,12 @@ def _acquire_pidfile() -> None:
             # Check if old process is actually a bot (not a recycled PID)
             try:
                 os.kill(old_pid, 0)  # probe — doesn't actually kill
-                # Process exists, kill it
-                os.kill(old_pid, signal.SIGTERM)
-                import time
-
-                time.sleep(2)  # give it time to shut down
+                if old_pid != os.getpid() and _is_bot_process(old_pid):
+                    os.kill(old_pid, signal.SIGTERM)
+                    # Wait up to 2s, returning as soon as it has exited
+                    for _ in range(20):
+                        time.sleep(0.1)
+                        os.kill(old_pid, 0)
             except ProcessLookupError:
                 pass  # already dead
             except PermissionError:
@@ -427,11 +488,15 @@ async def main() -> None:
 
     _acquire_pidfile()
 
-    logger = structlog.get_logger()
+    # Python 3.12+: run new tasks synchronously up to their first real await
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
+
     logger.info("Starting Claude Code Slack Bot", version=__version__)
 
     try:
-        from src.config import FeatureFlags, load_config
+        from src.config import load_config
 
         config = load_config(config_file=args.config_file)
         features = FeatureFlags(config)
@@ -444,7 +509,13 @@ async def main() -> None:
         )
 
         app = await create_application(config)
-        await run_application(app)
+        try:
+            await run_application(app)
+        finally:
+            # Closed here so a failure anywhere in run_application can't leak it
+            slack_session = app["slack_client"].session
+            if slack_session:
+                await slack_session.close()
 
     except ConfigurationError as e:
         logger.error("Configuration error", error=str(e))
@@ -464,8 +535,16 @@ def run() -> None:
         _release_pidfile()
         os._exit(1)
 
+    # uvloop comes with the optional "uvloop" extra; fall back to the stdlib loop
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        run_loop = asyncio.run
+    else:
+        run_loop = uvloop.run
+
     try:
-        asyncio.run(main())
+        run_loop(main())
     except KeyboardInterrupt:
         print("\nShutdown requested by user")
     finally:
@@ -5,7 +5,8 @@ through the Slack Web API with rate limiting (~1 msg/sec per channel).
 """
 
 import asyncio
-from typing import List, Optional
+from collections import deque
+from typing import Deque, Dict, List, Optional, Set
 
 import structlog
 from slack_sdk.errors import SlackApiError
@@ -19,10 +20,26 @@ logger = structlog.get_logger()
 # Slack rate limit: ~1 msg/sec per channel for chat.postMessage
 SEND_INTERVAL_SECONDS = 1.1
 
+# Channels idle longer than this no longer affect rate limiting
+_SEND_HISTORY_TTL_SECONDS = SEND_INTERVAL_SECONDS * 10
+_SEND_HISTORY_PRUNE_SIZE = 64
+
 
 class NotificationService:
     """Delivers agent responses to Slack channels with rate limiting."""
 
+    __slots__ = (
+        "event_bus",
+        "client",
+        "default_channel_ids",
+        "_send_queue",
+        "_last_send_per_channel",
+        "_running",
+        "_sender_task",
+        "_channel_backlogs",
+        "_channel_workers",
+    )
+
     def __init__(
         self,
         event_bus: EventBus,
@@ -32,10 +49,12 @@ class NotificationService:
         self.event_bus = event_bus
         self.client = client
         self.default_channel_ids = default_channel_ids or []
-        self._send_queue: asyncio.Queue[AgentResponseEvent] = asyncio.Queue()
+        self._send_queue: asyncio.Queue[Optional[AgentResponseEvent]] = asyncio.Queue()
         self._last_send_per_channel: dict[str, float] = {}
         self._running = False
         self._sender_task: Optional[asyncio.Task[None]] = None
+        self._channel_backlogs: Dict[str, Deque[AgentResponseEvent]] = {}
+        self._channel_workers: Set[asyncio.Task[None]] = set()
 
     def register(self) -> None:
         """Subscribe to agent response events."""
@@ -55,11 +74,12 @@ class NotificationService:
             return
         self._running = False
         if self._sender_task:
-            self._sender_task.cancel()
-            try:
-                await self._sender_task
-            except asyncio.CancelledError:
-                pass
+            # None wakes the processor so it can exit without a polling timeout
+            self._send_queue.put_nowait(None)
+            await self._sender_task
+        for worker in list(self._channel_workers):
+            worker.cancel()
+        await asyncio.gather(*self._channel_workers, return_exceptions=True)
         logger.info("Notification service stopped")
 
     async def handle_response(self, event: Event) -> None:
@@ -70,17 +90,48 @@ class NotificationService:
 
     async def _process_send_queue(self) -> None:
         """Process queued messages with rate limiting."""
-        while self._running:
-            try:
-                event = await asyncio.wait_for(self._send_queue.get(), timeout=1.0)
-            except asyncio.TimeoutError:
-                continue
-            except asyncio.CancelledError:
+        while True:
+            event = await self._send_queue.get()
+            if event is None:
                 break
 
-            channel_ids = self._resolve_channel_ids(event)
-            for channel_id in channel_ids:
-                await self._rate_limited_send(channel_id, event)
+            for channel_id in self._resolve_channel_ids(event):
+                self._dispatch(channel_id, event)
+
+    def _dispatch(self, channel_id: str, event: AgentResponseEvent) -> None:
+        """Hand an event to its channel's worker, starting one if idle.
+
+        Each channel drains its own backlog in order, so the send interval
+        only delays further messages to that channel.
+        """
+        backlog = self._channel_backlogs.get(channel_id)
+        if backlog is not None:
+            backlog.append(event)
+            return
+
+        backlog = self._channel_backlogs[channel_id] = deque((event,))
+        worker = asyncio.create_task(self._drain_channel(channel_id, backlog))
+        self._channel_workers.add(worker)
+        worker.add_done_callback(self._channel_workers.discard)
+
+    async def _drain_channel(
+        self, channel_id: str, backlog: Deque[AgentResponseEvent]
+    ) -> None:
+        """Send a channel's queued events, then retire the worker."""
+        try:
+            while backlog:
+                event = backlog.popleft()
+                try:
+                    await self._rate_limited_send(channel_id, event)
+                except Exception as e:
+                    logger.error(
+                        "Notification delivery failed",
+                        channel_id=channel_id,
+                        error=str(e),
+                        event_id=event.id,
+                    )
+        finally:
+            del self._channel_backlogs[channel_id]
 
     def _resolve_channel_ids(self, event: AgentResponseEvent) -> List[str]:
         """Determine which channels to send to."""
@@ -92,8 +143,10 @@ class NotificationService:
         self, channel_id: str, event: AgentResponseEvent
     ) -> None:
         """Send message with per-channel rate limiting."""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         now = loop.time()
+        if len(self._last_send_per_channel) > _SEND_HISTORY_PRUNE_SIZE:
+            self._prune_send_history(now)
         last_send = self._last_send_per_channel.get(channel_id, 0.0)
         wait_time = SEND_INTERVAL_SECONDS - (now - last_send)
 
@@ -104,20 +157,16 @@ class NotificationService:
             text = event.text
             chunks = self._split_message(text)
 
+            kwargs = {"channel": channel_id}
+            if event.thread_ts:
+                kwargs["thread_ts"] = event.thread_ts
+            multi_chunk = len(chunks) > 1
+
             for chunk in chunks:
-                kwargs = {
-                    "channel": channel_id,
-                    "text": chunk,
-                }
-                if event.thread_ts:
-                    kwargs["thread_ts"] = event.thread_ts
-
-                await self.client.chat_postMessage(**kwargs)
-                self._last_send_per_channel[channel_id] = (
-                    asyncio.get_event_loop().time()
-                )
-
-                if len(chunks) > 1:
+                await self.client.chat_postMessage(text=chunk, **kwargs)
+                self._last_send_per_channel[channel_id] = loop.time()
+
+                if multi_chunk:
                     await asyncio.sleep(SEND_INTERVAL_SECONDS)
 
             logger.info(
@@ -135,26 +184,41 @@ class NotificationService:
                 event_id=event.id,
             )
 
+    def _prune_send_history(self, now: float) -> None:
+        """Forget channels whose last send can no longer delay a new one."""
+        cutoff = now - _SEND_HISTORY_TTL_SECONDS
+        self._last_send_per_channel = {
+            channel_id: sent_at
+            for channel_id, sent_at in self._last_send_per_channel.items()
+            if sent_at > cutoff
+        }
+
     def _split_message(self, text: str, max_length: int = 3900) -> List[str]:
         """Split long messages at paragraph boundaries."""
         if len(text) <= max_length:
             return [text]
 
         chunks: List[str] = []
-        while text:
-            if len(text) <= max_length:
-                chunks.append(text)
+        start = 0
+        end_of_text = len(text)
+        while start < end_of_text:
+            limit = start + max_length
+            if end_of_text <= limit:
+                chunks.append(text[start:])
                 break
 
-            split_pos = text.rfind("\n\n", 0, max_length)
+            split_pos = text.rfind("\n\n", start, limit)
             if split_pos == -1:
-                split_pos = text.rfind("\n", 0, max_length)
+                split_pos = text.rfind("\n", start, limit)
             if split_pos == -1:
-                split_pos = text.rfind(" ", 0, max_length)
+                split_pos = text.rfind(" ", start, limit)
             if split_pos == -1:
-                split_pos = max_length
+                split_pos = limit
 
-            chunks.append(text[:split_pos])
-            text = text[split_pos:].lstrip()
+            chunks.append(text[start:split_pos])
+            # Skip the whitespace the next chunk would otherwise start with
+            start = split_pos
+            while start < end_of_text and text[start].isspace():
+                start += 1
 
         return chunks
@@ -6,6 +6,9 @@ from typing import Dict, List, Optional
 
 import yaml
 
+# libyaml's C parser when PyYAML was built with it; same safe semantics
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass(frozen=True)
 class ProjectDefinition:
@@ -57,7 +60,7 @@ def load_project_registry(
         raise ValueError(f"Projects config file does not exist: {config_path}")
 
     with open(config_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=_YAML_LOADER) or {}
 
     if not isinstance(data, dict):
         raise ValueError("Projects config must be a YAML object")
@@ -0,0 +1,253 @@
+"""Test the in-process bot MCP tools."""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.claude.mcp_tools import (
+    _MAX_ERROR_CHARS,
+    ToolResult,
+    _ErrorBudget,
+    _legacy_adapt,
+    _make_batch_tool,
+    _memoize_job_listing,
+    create_bot_mcp_server,
+)
+
+
+def _batch(handlers):
+    return _make_batch_tool(handlers, _ErrorBudget()).handler
+
+
+async def _noop(*args):
+    return ToolResult("ok")
+
+
+def _registered_tool_names(**kwargs):
+    with patch("src.claude.mcp_tools.create_sdk_mcp_server") as create_server:
+        create_bot_mcp_server(**kwargs)
+    return [t.name for t in create_server.call_args.kwargs["tools"]]
+
+
+class TestCreateBotMcpServer:
+    """Test which tools get registered on the bot MCP server."""
+
+    def test_registers_tools_for_given_callbacks(self):
+        names = _registered_tool_names(file_upload_fn=_noop, scheduler_fn=_noop)
+        assert names == [
+            "SlackFileUpload",
+            "ScheduleJob",
+            "ListScheduledJobs",
+            "RemoveScheduledJob",
+            "SchedulerHelp",
+            "BatchExecute",
+        ]
+
+    def test_enabled_tools_filters_registration(self):
+        names = _registered_tool_names(
+            file_upload_fn=_noop,
+            scheduler_fn=_noop,
+            reaction_fn=_noop,
+            enabled_tools={"SlackReaction", "ListScheduledJobs"},
+        )
+        assert names == ["SlackReaction", "ListScheduledJobs"]
+
+
+class TestLegacyAdapt:
+    """Test adaptation of string-returning callbacks."""
+
+    async def test_string_results_are_classified(self):
+        async def legacy(args):
+            return args["text"]
+
+        adapted = _legacy_adapt(legacy)
+
+        assert await adapted({"text": "Done."}) == ToolResult("Done.")
+        assert await adapted({"text": "Error: nope"}) == ToolResult(
+            "Error: nope", is_error=True
+        )
+        assert (await adapted({"text": "error: lower"})).is_error
+
+    async def test_tool_results_pass_through(self):
+        result = ToolResult("Error-free text", is_error=False)
+
+        async def migrated(args):
+            return result
+
+        assert await _legacy_adapt(migrated)({}) is result
+
+
+class TestErrorBudget:
+    """Test trimming of error results and retry-loop detection."""
+
+    def test_success_passes_through(self):
+        result = ToolResult("x" * 2000)
+        assert _ErrorBudget().screen("SlackReaction", result) is result
+
+    def test_long_error_is_truncated(self):
+        result = _ErrorBudget().screen(
+            "SlackFileUpload", ToolResult("Error: " + "x" * 2000, is_error=True)
+        )
+        assert result.is_error
+        assert len(result.text) < _MAX_ERROR_CHARS + 20
+        assert result.text.endswith("[truncated]")
+
+    def test_repeated_error_is_cut_off(self):
+        errors = _ErrorBudget()
+        failure = ToolResult("Error: invalid_name", is_error=True)
+
+        texts = [errors.screen("SlackReaction", failure).text for _ in range(4)]
+
+        assert texts[:3] == ["Error: invalid_name"] * 3
+        assert texts[3].startswith("REPEATED_ERROR")
+        assert errors.screen("SlackFileUpload", failure).text == "Error: invalid_name"
+
+
+class TestMemoization:
+    """Test short-lived reuse of idempotent tool results."""
+
+    async def test_job_listing_reused_until_jobs_change(self):
+        calls = []
+
+        async def scheduler(tool_name, args):
+            calls.append(tool_name)
+            return ToolResult("ok")
+
+        memoized = _memoize_job_listing(scheduler)
+        await memoized("ListScheduledJobs", {})
+        await memoized("ListScheduledJobs", {})
+        await memoized("ScheduleJob", {})
+        await memoized("ListScheduledJobs", {})
+
+        assert calls == ["ListScheduledJobs", "ScheduleJob", "ListScheduledJobs"]
+
+
+class TestBatchExecute:
+    """Test BatchExecute fan-out over the bot tool callbacks."""
+
+    async def test_runs_calls_in_order(self):
+        async def react(args):
+            return ToolResult(f"Added :{args['emoji_name']}: reaction.")
+
+        result = await _batch({"SlackReaction": react})(
+            {
+                "calls": [
+                    {"tool_name": "SlackReaction", "arguments": {"emoji_name": "eyes"}},
+                    {"tool_name": "SlackReaction", "arguments": {"emoji_name": "tada"}},
+                ]
+            }
+        )
+
+        assert result["is_error"] is False
+        entries = json.loads(result["content"][0]["text"])
+        assert [e["text"] for e in entries] == [
+            "Added :eyes: reaction.",
+            "Added :tada: reaction.",
+        ]
+
+    async def test_unknown_tool_and_exception_are_errors(self):
+        async def upload(args):
+            raise RuntimeError("disk gone")
+
+        result = await _batch({"SlackFileUpload": upload})(
+            {
+                "calls": [
+                    {"tool_name": "SlackFileUpload", "arguments": {}},
+                    {"tool_name": "Bash", "arguments": {}},
+                ]
+            }
+        )
+
+        assert result["is_error"] is True
+        entries = json.loads(result["content"][0]["text"])
+        assert entries[0]["text"] == "Error: disk gone"
+        assert "unknown tool" in entries[1]["text"]
+
+    async def test_stop_on_error_cancels_pending_calls(self):
+        started = []
+
+        async def react(args):
+            started.append(args["emoji_name"])
+            if args["emoji_name"] == "bad":
+                return ToolResult("Error: invalid_name", is_error=True)
+            await asyncio.sleep(1)
+            return ToolResult("Added")
+
+        result = await _batch({"SlackReaction": react})(
+            {
+                "calls": [
+                    {"tool_name": "SlackReaction", "arguments": {"emoji_name": "bad"}},
+                    {"tool_name": "SlackReaction", "arguments": {"emoji_name": "ok"}},
+                ],
+                "stop_on_error": True,
+                "max_concurrent": 1,
+            }
+        )
+
+        entries = json.loads(result["content"][0]["text"])
+        assert result["is_error"] is True
+        assert entries[0]["is_error"] is True
+        assert entries[1] == {"tool_name": "SlackReaction", "skipped": True}
+        assert started == ["bad"]
+
+    @pytest.mark.parametrize("limit", [0, -2, "many"])
+    async def test_invalid_max_concurrent_is_rejected(self, limit):
+        result = await _batch({"SlackReaction": _noop})(
+            {
+                "calls": [{"tool_name": "SlackReaction", "arguments": {}}],
+                "max_concurrent": limit,
+            }
+        )
+
+        assert result["is_error"] is True
+        assert "max_concurrent" in result["content"][0]["text"]
+
+    @pytest.mark.parametrize(
+        "calls",
+        [
+            [{"tool_name": "SlackReaction", "arguments": {}}, "SlackReaction"],
+            [42],
+            [["SlackReaction"]],
+            {"SlackReaction": {}},
+        ],
+    )
+    async def test_malformed_calls_are_rejected(self, calls):
+        result = await _batch({"SlackReaction": _noop})({"calls": calls})
+
+        assert result["is_error"] is True
+        assert "calls must be" in result["content"][0]["text"]
+
+    @pytest.mark.skipif(
+        not hasattr(asyncio, "eager_task_factory"),
+        reason="eager task factory needs Python 3.12+",
+    )
+    async def test_stop_on_error_under_eager_tasks(self):
+        started = []
+
+        async def react(args):
+            started.append(args["emoji_name"])
+            return ToolResult("Added")
+
+        loop = asyncio.get_running_loop()
+        loop.set_task_factory(asyncio.eager_task_factory)
+        try:
+            result = await _batch({"SlackReaction": react})(
+                {
+                    "calls": [
+                        {"tool_name": "Bash", "arguments": {}},
+                        {
+                            "tool_name": "SlackReaction",
+                            "arguments": {"emoji_name": "ok"},
+                        },
+                    ],
+                    "stop_on_error": True,
+                }
+            )
+        finally:
+            loop.set_task_factory(None)
+
+        entries = json.loads(result["content"][0]["text"])
+        assert entries[1] == {"tool_name": "SlackReaction", "skipped": True}
+        assert started == []
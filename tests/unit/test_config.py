@@ -198,6 +198,12 @@ def test_mcp_config_validation(tmp_path, monkeypatch):
     assert settings.enable_mcp is True
     assert settings.mcp_config_path == config_file
 
+    # Contents are not parsed while MCP is disabled
+    settings = _make_settings(
+        str(test_dir), enable_mcp=False, mcp_config_path=str(bad_json_file)
+    )
+    assert settings.mcp_config_path == bad_json_file
+
 
 def test_log_level_validation():
     """Test log level validation."""
@@ -1,5 +1,6 @@
 """Tests for event handlers."""
 
+import asyncio
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
@@ -104,6 +105,66 @@ class TestAgentHandler:
         assert len(response_events) == 1
         assert response_events[0].channel_id == "C01TEST"
 
+    async def test_scheduled_event_dedupes_channels(
+        self, event_bus: EventBus, mock_claude: AsyncMock
+    ) -> None:
+        """A channel listed twice only gets one orchestrator run."""
+        orchestrator = MagicMock()
+        orchestrator.run_scheduled_prompt = AsyncMock()
+        handler = AgentHandler(
+            event_bus=event_bus,
+            claude_integration=mock_claude,
+            default_working_directory=Path("/tmp/test"),
+            slack_client=MagicMock(),
+            orchestrator=orchestrator,
+        )
+
+        await handler.handle_scheduled(
+            ScheduledEvent(
+                job_name="standup",
+                prompt="report",
+                target_channel_ids=["C1", "C2", "C1"],
+            )
+        )
+
+        channels = [
+            c.kwargs["channel_id"]
+            for c in orchestrator.run_scheduled_prompt.call_args_list
+        ]
+        assert channels == ["C1", "C2"]
+
+    async def test_scheduled_channels_run_concurrently(
+        self, event_bus: EventBus, mock_claude: AsyncMock
+    ) -> None:
+        """Channel runs overlap and one failure doesn't stop the others."""
+        running: list = []
+        overlapped: list = []
+
+        async def run_scheduled_prompt(**kwargs):  # type: ignore[no-untyped-def]
+            running.append(kwargs["channel_id"])
+            await asyncio.sleep(0)
+            overlapped.append(len(running))
+            running.remove(kwargs["channel_id"])
+            if kwargs["channel_id"] == "C1":
+                raise RuntimeError("boom")
+
+        orchestrator = MagicMock()
+        orchestrator.run_scheduled_prompt = AsyncMock(side_effect=run_scheduled_prompt)
+        handler = AgentHandler(
+            event_bus=event_bus,
+            claude_integration=mock_claude,
+            default_working_directory=Path("/tmp/test"),
+            slack_client=MagicMock(),
+            orchestrator=orchestrator,
+        )
+
+        await handler.handle_scheduled(
+            ScheduledEvent(job_name="j", prompt="p", target_channel_ids=["C1", "C2"])
+        )
+
+        assert orchestrator.run_scheduled_prompt.await_count == 2
+        assert max(overlapped) == 2
+
     async def test_scheduled_event_with_skill(
         self, event_bus: EventBus, mock_claude: AsyncMock, agent_handler: AgentHandler
     ) -> None:
@@ -140,6 +201,23 @@ class TestAgentHandler:
         # Should not raise
         await agent_handler.handle_webhook(event)
 
+    async def test_webhook_dropped_without_notification_channels(
+        self, event_bus: EventBus, mock_claude: AsyncMock
+    ) -> None:
+        """Webhooks are not run through Claude when nothing would receive them."""
+        handler = AgentHandler(
+            event_bus=event_bus,
+            claude_integration=mock_claude,
+            default_working_directory=Path("/tmp/test"),
+            notification_channel_ids=[],
+        )
+
+        await handler.handle_webhook(
+            WebhookEvent(provider="github", event_type_name="push", payload={})
+        )
+
+        mock_claude.run_command.assert_not_called()
+
     def test_build_webhook_prompt(self, agent_handler: AgentHandler) -> None:
         """Webhook prompt includes provider and event info."""
         event = WebhookEvent(
@@ -158,3 +236,21 @@ class TestAgentHandler:
         big_payload = {"key": "x" * 3000}
         summary = agent_handler._summarize_payload(big_payload)
         assert len(summary) <= 2100  # 2000 + truncation message
+
+    def test_payload_summary_order_and_early_stop(
+        self, agent_handler: AgentHandler
+    ) -> None:
+        """Nested payloads flatten depth-first and stop at the size budget."""
+        payload = {"a": {"b": 1, "c": [1, 2]}, "d": "x"}
+        assert agent_handler._summarize_payload(payload, max_depth=4).split("\n") == [
+            "a.b: 1",
+            "a.c: [2 items]",
+            "a.c[0]: 1",
+            "a.c[1]: 2",
+            "d: x",
+        ]
+
+        lines = agent_handler._flatten_dict(
+            {f"k{i}": "v" * 100 for i in range(100)}, max_chars=2000
+        )
+        assert len(lines) == 19  # the line that crosses 2000 chars is the last
@@ -1,5 +1,6 @@
 """Tests for event types."""
 
+import sys
 from pathlib import Path
 
 from src.events.types import (
@@ -61,3 +62,9 @@ class TestEventTypes:
         )
         assert event.skill_name == "daily-standup"
         assert event.working_directory == Path("/projects/myapp")
+
+    def test_names_are_interned(self) -> None:
+        provider = "".join(["git", "hub"])
+        event = WebhookEvent(provider=provider, event_type_name="".join(["pu", "sh"]))
+        assert event.provider is sys.intern("github")
+        assert event.event_type_name is sys.intern("push")
@@ -0,0 +1,63 @@
+"""Test helpers of the application entry point."""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from src.main import _is_bot_cmdline, _is_bot_process
+
+
+def test_import_skips_agent_sdk():
+    """Importing the entry point leaves claude_agent_sdk to SDK mode."""
+    # A fresh interpreter: this test session has already imported the SDK
+    code = "import sys, src.main; print('claude_agent_sdk' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).parents[2],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
+
+
+class TestIsBotProcess:
+    """Test recognition of a previous bot instance from its command line."""
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["/srv/.venv/bin/python", "/srv/.venv/bin/claude-slack-bot", "--debug"],
+            ["python3.11", "-m", "src.main"],
+            ["python", "src/main.py"],
+        ],
+    )
+    def test_bot_launch_styles(self, argv):
+        assert _is_bot_cmdline(argv)
+
+    @pytest.mark.parametrize(
+        "argv", [["python3", "-m", "http.server"], ["sleep", "30"], [""]]
+    )
+    def test_other_commands(self, argv):
+        assert not _is_bot_cmdline(argv)
+
+    @pytest.mark.skipif(not Path("/proc/self/cmdline").exists(), reason="needs /proc")
+    @pytest.mark.parametrize(
+        "extra_args, expected", [(["src.main"], True), (["other"], False)]
+    )
+    def test_reads_live_process(self, extra_args, expected):
+        proc = subprocess.Popen(
+            [sys.executable, "-c", "import sys; sys.stdin.read()", *extra_args],
+            stdin=subprocess.PIPE,
+        )
+        try:
+            # Popen can return before the child has exec'd its command line
+            cmdline = Path(f"/proc/{proc.pid}/cmdline")
+            while not cmdline.read_bytes():
+                time.sleep(0.01)
+            assert _is_bot_process(proc.pid) is expected
+        finally:
+            proc.communicate()
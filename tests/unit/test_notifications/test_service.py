@@ -1,11 +1,13 @@
 """Tests for the notification service."""
 
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
 
 from src.events.bus import Event, EventBus
 from src.events.types import AgentResponseEvent
+from src.notifications import service as service_module
 from src.notifications.service import NotificationService
 
 
@@ -81,6 +83,14 @@ class TestNotificationService:
         assert len(chunks[0]) == 3900
         assert len(chunks[1]) == 1100
 
+    def test_split_message_prefers_paragraphs(
+        self, service: NotificationService
+    ) -> None:
+        """Splits land on the latest boundary and drop leading whitespace."""
+        text = "aaaa bbbb\ncccc\n\n  dddd eeee ffff"
+        chunks = service._split_message(text, max_length=16)
+        assert chunks == ["aaaa bbbb\ncccc", "dddd eeee ffff"]
+
     async def test_send_to_slack(
         self, service: NotificationService, mock_client: AsyncMock
     ) -> None:
@@ -93,6 +103,78 @@ class TestNotificationService:
         assert call_kwargs["channel"] == "C123"
         assert call_kwargs["text"] == "hello world"
 
+    async def test_every_chunk_keeps_thread(
+        self,
+        service: NotificationService,
+        mock_client: AsyncMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Each chunk of a split message is posted to the same thread."""
+        monkeypatch.setattr(service_module, "SEND_INTERVAL_SECONDS", 0)
+        event = AgentResponseEvent(channel_id="C1", text="A" * 5000, thread_ts="1.2")
+        await service._rate_limited_send("C1", event)
+
+        calls = mock_client.chat_postMessage.call_args_list
+        assert len(calls) == 2
+        assert all(c.kwargs["thread_ts"] == "1.2" for c in calls)
+
+    def test_prune_send_history(self, service: NotificationService) -> None:
+        """Channels idle past the history TTL are forgotten."""
+        service._last_send_per_channel = {"C_OLD": 0.0, "C_NEW": 100.0}
+        service._prune_send_history(now=100.5)
+        assert service._last_send_per_channel == {"C_NEW": 100.0}
+
+    async def test_channels_send_independently(
+        self, service: NotificationService, mock_client: AsyncMock
+    ) -> None:
+        """A slow channel does not hold up sends to other channels."""
+        release = asyncio.Event()
+        sent = []
+
+        async def post(**kwargs):
+            sent.append(kwargs["channel"])
+            if kwargs["channel"] == "C001":
+                await release.wait()
+            return {"ok": True}
+
+        mock_client.chat_postMessage.side_effect = post
+        service._dispatch("C001", AgentResponseEvent(channel_id="C001", text="a"))
+        service._dispatch("C002", AgentResponseEvent(channel_id="C002", text="b"))
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert sent == ["C001", "C002"]
+
+        release.set()
+        await asyncio.gather(*service._channel_workers)
+        assert service._channel_backlogs == {}
+
+    async def test_channel_backlog_keeps_order(
+        self,
+        service: NotificationService,
+        mock_client: AsyncMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Events queued for one channel are sent in arrival order."""
+        monkeypatch.setattr(service_module, "SEND_INTERVAL_SECONDS", 0)
+        for text in ("one", "two", "three"):
+            service._dispatch("C001", AgentResponseEvent(channel_id="C001", text=text))
+        await asyncio.gather(*service._channel_workers)
+
+        texts = [c.kwargs["text"] for c in mock_client.chat_postMessage.call_args_list]
+        assert texts == ["one", "two", "three"]
+
+    async def test_stop_wakes_idle_processor(
+        self, service: NotificationService, mock_client: AsyncMock
+    ) -> None:
+        """stop() ends the processor after dispatching what was queued."""
+        await service.start()
+        await service.handle_response(AgentResponseEvent(channel_id="C1", text="x"))
+        await service.stop()
+
+        assert service._sender_task is not None
+        assert service._sender_task.done()
+        assert service._send_queue.empty()
+
     async def test_ignores_non_response_events(
         self, service: NotificationService
     ) -> None:
@@ -87,7 +87,8 @@ class TestReactionCallback:
         client.reactions_add.assert_called_once_with(
             name="thumbsup", channel="C01CH", timestamp="1234.5678"
         )
-        assert "Added" in result
+        assert not result.is_error
+        assert "Added" in result.text
 
     async def test_removes_reaction(self, orchestrator):
         client = AsyncMock()
@@ -97,7 +98,8 @@ class TestReactionCallback:
         result = await cb({"emoji_name": "thumbsup", "remove": True})
 
         client.reactions_remove.assert_called_once()
-        assert "Removed" in result
+        assert not result.is_error
+        assert "Removed" in result.text
 
     async def test_strips_colons(self, orchestrator):
         client = AsyncMock()
@@ -116,14 +118,36 @@ class TestReactionCallback:
         cb = orchestrator._make_reaction_callback("C01CH", "1234.5678", client)
 
         result = await cb({"emoji_name": "thumbsup"})
-        assert "Already" in result
+        assert not result.is_error
+        assert "Already" in result.text
+
+    async def test_redundant_add_skips_slack(self, orchestrator):
+        client = AsyncMock()
+        cb = orchestrator._make_reaction_callback("C01CH", "1234.5678", client)
+
+        await cb({"emoji_name": "eyes"})
+        again = await cb({"emoji_name": "eyes"})
+
+        client.reactions_add.assert_called_once()
+        assert "Already" in again.text
+
+    async def test_remove_unknown_reaction_calls_slack(self, orchestrator):
+        client = AsyncMock()
+        cb = orchestrator._make_reaction_callback("C01CH", "1234.5678", client)
+
+        result = await cb({"emoji_name": "fire", "remove": True})
+
+        client.reactions_remove.assert_called_once_with(
+            name="fire", channel="C01CH", timestamp="1234.5678"
+        )
+        assert "Removed" in result.text
 
     async def test_empty_emoji_returns_error(self, orchestrator):
         client = AsyncMock()
         cb = orchestrator._make_reaction_callback("C01CH", "1234.5678", client)
 
         result = await cb({"emoji_name": ""})
-        assert "Error" in result
+        assert result.is_error
 
 
 class TestFileUploadCallback:
@@ -133,13 +157,13 @@ class TestFileUploadCallback:
         client = AsyncMock()
         cb = orchestrator._make_file_upload_callback("C01CH", "U01USER", client)
         result = await cb({"file_path": ""})
-        assert "Error" in result
+        assert result.is_error
 
     async def test_nonexistent_file(self, orchestrator):
         client = AsyncMock()
         cb = orchestrator._make_file_upload_callback("C01CH", "U01USER", client)
         result = await cb({"file_path": "/nonexistent/file.txt"})
-        assert "Error" in result
+        assert result.is_error
 
 
 class TestSchedulerCallback:
@@ -151,7 +175,8 @@ class TestSchedulerCallback:
             "C01CH", "U01USER", working_directory="/tmp"
         )
         result = await cb("UnknownTool", {})
-        assert "Unknown" in result
+        assert result.is_error
+        assert "Unknown" in result.text
 
     def test_no_scheduler_returns_none(self, orchestrator):
         """When scheduler is not in deps, callback factory returns None."""